@@ -213,11 +213,17 @@ def _run_workflow_impl(args):
             else:
                 raise ValueError("Cannot resume: Workspace directory not found")
 
+        # Without an explicit --base-dir, a custom workspace's parent acts as
+        # the base directory so nothing is created under ./runs
+        base_dir = args.base_dir
+        if base_dir is None:
+            base_dir = str(Path(args.workspace).parent) if args.workspace else "runs"
+
         # Create workflow engine with loaded metadata
         engine = WorkflowEngine(
             workflow=args.workflow,
             workspace=args.workspace,
-            base_dir=args.base_dir,
+            base_dir=base_dir,
             metadata=metadata,  # Pass loaded metadata to engine
             dry_run=getattr(args, "dry_run", False),
         )
@@ -828,7 +834,10 @@ Commands:
     run_parser.add_argument("workflow", help="Path to workflow file")
     run_parser.add_argument("--workspace", help="Custom workspace directory")
     run_parser.add_argument(
-        "--base-dir", default="runs", help="Base directory for workflow runs"
+        "--base-dir",
+        default=None,
+        help="Base directory for workflow runs "
+        "(default: parent of --workspace if given, otherwise 'runs')",
     )
     run_parser.add_argument(
         "--resume", action="store_true", help="Resume workflow from last failed step"
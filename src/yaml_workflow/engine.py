@@ -36,7 +36,7 @@ from .exceptions import (
 from .state import ExecutionState, WorkflowState
 from .tasks import TaskConfig, get_task_handler
 from .template import TemplateEngine
-from .utils.yaml_utils import get_safe_loader
+from .utils.yaml_utils import load_workflow_yaml
 from .workspace import create_workspace, get_workspace_info
 
 # ---------------------------------------------------------------------------
@@ -186,11 +186,13 @@ class WorkflowEngine:
             self.workflow_file = None
         else:
             self.workflow_file = Path(workflow)
-            if not self.workflow_file.exists():
+            # Read once; a missing file surfaces from the read itself
+            try:
+                data = self.workflow_file.read_bytes()
+            except FileNotFoundError:
                 raise WorkflowError(f"Workflow file not found: {workflow}")
             try:
-                with open(self.workflow_file) as f:
-                    self.workflow = yaml.load(f, Loader=get_safe_loader())
+                self.workflow = load_workflow_yaml(data, str(self.workflow_file))
             except yaml.YAMLError as e:
                 raise WorkflowError(f"Invalid YAML in workflow file: {e}")
 
@@ -427,14 +429,15 @@ class WorkflowEngine:
 
             # Resolve relative to the workflow file's directory
             resolved = (workflow_file.parent / import_path).resolve()
-            if not resolved.exists():
+            try:
+                data = resolved.read_bytes()
+            except FileNotFoundError:
                 raise WorkflowImportError(import_path, f"File not found: {resolved}")
 
             all_imported_files.append(resolved)
 
             try:
-                with open(resolved) as f:
-                    imported_workflow = yaml.load(f, Loader=get_safe_loader())
+                imported_workflow = load_workflow_yaml(data, str(resolved))
             except yaml.YAMLError as e:
                 raise WorkflowImportError(import_path, f"Invalid YAML: {e}")
 
@@ -967,7 +970,6 @@ class WorkflowEngine:
                                 step_name,
                                 f"Invalid on_error.next target: {error_flow_target}",
                             )
-                            self.state.save()
                             raise WorkflowError(
                                 f"Invalid on_error.next target '{error_flow_target}' for step '{step_name}'"
                             ) from e
@@ -1018,19 +1020,21 @@ class WorkflowEngine:
             all_planned_steps = {s["name"] for s in flow_steps}
             executed_or_failed_steps = set(final_state["step_outputs"].keys())
             skipped_by_jump = all_planned_steps - executed_or_failed_steps
-            for skipped_step_name in skipped_by_jump:
-                if (
-                    skipped_step_name not in final_state["step_outputs"]
-                ):  # Avoid overwriting if skipped by condition
-                    self.logger.info(
-                        f"Marking step '{skipped_step_name}' as skipped due to workflow jump/completion."
-                    )
-                    self.state.mark_step_skipped(
-                        skipped_step_name,
-                        reason="Workflow execution path skipped this step",
-                    )
+            # One write for all the skipped steps and the completion mark
+            with self.state.deferred_save():
+                for skipped_step_name in skipped_by_jump:
+                    if (
+                        skipped_step_name not in final_state["step_outputs"]
+                    ):  # Avoid overwriting if skipped by condition
+                        self.logger.info(
+                            f"Marking step '{skipped_step_name}' as skipped due to workflow jump/completion."
+                        )
+                        self.state.mark_step_skipped(
+                            skipped_step_name,
+                            reason="Workflow execution path skipped this step",
+                        )
 
-            self.state.mark_workflow_completed()
+                self.state.mark_workflow_completed()
             # No need to save state here, mark_workflow_completed and mark_step_skipped already do
             # self.state.save()
 
@@ -1291,8 +1295,6 @@ class WorkflowEngine:
             self.state.mark_step_skipped(
                 step_name, reason=f"Condition '{condition}' not met"
             )
-            if not self.dry_run:
-                self.state.save()  # Save state after marking skipped
             return
 
         # --- Dry-run: preview without executing ---
@@ -1366,14 +1368,14 @@ class WorkflowEngine:
             self.logger.debug(f"Processing successful result for step '{step_name}'.")
             # Store the raw task result under the 'result' key in the steps namespace
             # Use lock for thread-safety during parallel DAG execution
-            with self._context_lock:
-                self.context["steps"][step_name] = {"result": result}
-                # Mark step as executed successfully in state
-                self.state.mark_step_success(
-                    step_name, self.context["steps"][step_name]
-                )
-                self.state.save()
-            self.state.reset_step_retries(step_name)
+            with self.state.deferred_save():
+                with self._context_lock:
+                    self.context["steps"][step_name] = {"result": result}
+                    # Mark step as executed successfully in state
+                    self.state.mark_step_success(
+                        step_name, self.context["steps"][step_name]
+                    )
+                self.state.reset_step_retries(step_name)
             self.current_step = None
             self.logger.info(f"Step '{step_name}' executed successfully.")
             return
@@ -1475,10 +1477,12 @@ class WorkflowEngine:
                 self.logger.warning(
                     f"Step '{step_name}' failed, but workflow continues due to on_error.action='continue'"
                 )
-                self.state.mark_step_failed(step_name, final_error_message_for_state)
-                self.state.clear_error_flow_target()
-                # Save state and return, allowing run loop to continue
-                self.state.save()
+                with self.state.deferred_save():
+                    self.state.mark_step_failed(
+                        step_name, final_error_message_for_state
+                    )
+                    self.state.clear_error_flow_target()
+                # State is saved on leaving the block; return, allowing run loop to continue
                 return  # NOTE: Execution stops here for 'continue'
 
             error_next_step = on_error_config.get("next")
@@ -1487,10 +1491,11 @@ class WorkflowEngine:
                     f"Proceeding to error handling step: {error_next_step}"
                 )
                 # Mark the step as failed before setting the jump target
-                self.state.mark_step_failed(step_name, final_error_message_for_state)
-                self.state.set_error_flow_target(error_next_step)
-                # Save state before raising exception for jump
-                self.state.save()
+                with self.state.deferred_save():
+                    self.state.mark_step_failed(
+                        step_name, final_error_message_for_state
+                    )
+                    self.state.set_error_flow_target(error_next_step)
                 raise TaskExecutionError(
                     step_name, original_error=error_to_propagate
                 )  # Re-raise TaskExecutionError for jump
@@ -1499,8 +1504,6 @@ class WorkflowEngine:
                     f"No error handling ('on_error.next' or 'continue') defined for step '{step_name}'. Halting workflow."
                 )
                 self.state.mark_step_failed(step_name, final_error_message_for_state)
-                # Save state before raising exception for halt
-                self.state.save()
                 raise TaskExecutionError(
                     step_name, original_error=error_to_propagate
                 )  # Re-raise TaskExecutionError for halt
@@ -5,11 +5,12 @@ This module handles the persistence and management of workflow execution state,
 including step completion, outputs, and retry mechanisms.
 """
 
-import copy
 import json
+import threading
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional, TypedDict, cast
+from typing import Any, Dict, Iterator, List, Literal, Optional, TypedDict, cast
 
 
 # Type definitions
@@ -37,6 +38,11 @@ METADATA_FILE = ".workflow_metadata.json"
 DEFAULT_NAMESPACES: NamespaceDict = {"args": {}, "env": {}, "steps": {}, "batch": {}}
 
 
+def _empty_namespaces() -> NamespaceDict:
+    """Fresh copy of DEFAULT_NAMESPACES, without going through deepcopy."""
+    return {"args": {}, "env": {}, "steps": {}, "batch": {}}
+
+
 class WorkflowState:
     """Manages workflow execution state and persistence."""
 
@@ -49,6 +55,10 @@ class WorkflowState:
         """
         self.workspace = workspace
         self.metadata_path = workspace / METADATA_FILE
+        # Nesting depth of deferred_save() blocks and whether a save was skipped
+        self._defer_lock = threading.Lock()
+        self._defer_depth = 0
+        self._save_pending = False
 
         # Initialize with empty state
         self.metadata: Dict[str, Any] = {
@@ -67,7 +77,7 @@ class WorkflowState:
                     "error_flow_target": None,
                 },
             ),
-            "namespaces": copy.deepcopy(DEFAULT_NAMESPACES),
+            "namespaces": _empty_namespaces(),
         }
 
         if metadata is not None:
@@ -83,7 +93,7 @@ class WorkflowState:
             if "error_flow_target" not in self.metadata["execution_state"]:
                 self.metadata["execution_state"]["error_flow_target"] = None
             if "namespaces" not in self.metadata:
-                self.metadata["namespaces"] = copy.deepcopy(DEFAULT_NAMESPACES)
+                self.metadata["namespaces"] = _empty_namespaces()
             self.save()
         else:
             self._load_state()
@@ -113,14 +123,45 @@ class WorkflowState:
                 },
             )
         if "namespaces" not in self.metadata:
-            self.metadata["namespaces"] = copy.deepcopy(DEFAULT_NAMESPACES)
+            self.metadata["namespaces"] = _empty_namespaces()
         self.save()
 
     def save(self) -> None:
-        """Save current state to metadata file."""
+        """Save current state to metadata file.
+
+        Inside a ``deferred_save()`` block the write is postponed until the
+        outermost block exits.
+        """
+        with self._defer_lock:
+            if self._defer_depth:
+                self._save_pending = True
+                return
+            self._save_pending = False
         self.metadata["execution_state"]["last_updated"] = datetime.now().isoformat()
+        # Encode in one shot rather than streaming through json.dump's chunked
+        # writes; this also leaves the file untouched if encoding fails
+        data = json.dumps(self.metadata, indent=2)
         with open(self.metadata_path, "w") as f:
-            json.dump(self.metadata, f, indent=2)
+            f.write(data)
+
+    @contextmanager
+    def deferred_save(self) -> Iterator[None]:
+        """Coalesce the saves made inside the block into a single write.
+
+        Updates that each call ``save()`` (such as marking a step successful
+        and clearing its retries) then rewrite the metadata file once, when
+        the outermost block exits, even if it exits with an exception.
+        """
+        with self._defer_lock:
+            self._defer_depth += 1
+        try:
+            yield
+        finally:
+            with self._defer_lock:
+                self._defer_depth -= 1
+                flush = not self._defer_depth and self._save_pending
+            if flush:
+                self.save()
 
     def get_state(self) -> Dict[str, Any]:
         """Get the current workflow state.
@@ -198,13 +239,13 @@ class WorkflowState:
         state["status"] = "in_progress"  # Workflow status
         if state["failed_step"] and state["failed_step"]["step_name"] == step_name:
             state["failed_step"] = None
-        self.reset_step_retries(step_name)
+        self._clear_step_retries(step_name)
         self.save()
 
     def mark_step_failed(self, step_name: str, error: str) -> None:
         """Mark a step as terminally failed (retries exhausted/no error flow)."""
         state = cast(ExecutionState, self.metadata["execution_state"])
-        self.reset_step_retries(step_name)
+        self._clear_step_retries(step_name)
         state["failed_step"] = {
             "step_name": step_name,
             "error": error,
@@ -299,12 +340,7 @@ class WorkflowState:
             },
         )
         # Create a fresh copy of empty namespaces
-        self.metadata["namespaces"] = {
-            "args": {},
-            "env": {},
-            "steps": {},
-            "batch": {},
-        }
+        self.metadata["namespaces"] = _empty_namespaces()
         self.save()
 
     def get_step_retry_count(self, step_name: str) -> int:
@@ -320,10 +356,14 @@ class WorkflowState:
         retry_counts[step_name] = current_count + 1
         self.save()
 
-    def reset_step_retries(self, step_name: str) -> None:
-        """Clear the retry state for a specific step."""
+    def _clear_step_retries(self, step_name: str) -> None:
+        """Drop the retry count for a step without saving."""
         state = cast(ExecutionState, self.metadata["execution_state"])
         state.setdefault("retry_counts", {}).pop(step_name, None)
+
+    def reset_step_retries(self, step_name: str) -> None:
+        """Clear the retry state for a specific step."""
+        self._clear_step_retries(step_name)
         self.save()
 
     def set_error_flow_target(self, target_step_name: str) -> None:
@@ -8,9 +8,19 @@ Each module provides specific functionality that can be referenced in workflow Y
 import importlib.metadata
 import inspect
 import logging
-from functools import wraps
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 from ..types import TaskHandler
 from .config import TaskConfig
@@ -22,6 +32,59 @@ R = TypeVar("R")
 _task_registry: Dict[str, TaskHandler] = {}
 
 
+@lru_cache(maxsize=None)
+def _task_signature(
+    func: Callable[..., Any],
+) -> Tuple[
+    Mapping[str, inspect.Parameter],
+    bool,
+    Optional[str],
+    Optional[str],
+    Optional[str],
+    Optional[str],
+]:
+    """Inspect a task function once, on its first call.
+
+    Returns:
+        The parameters, whether the function takes only ``config: TaskConfig``,
+        and the names of its ``*args``, ``**kwargs``, ``TaskConfig`` and
+        ``context`` parameters (``None`` when absent).
+    """
+    params = inspect.signature(func).parameters
+    config_only = (
+        list(params.keys()) == ["config"] and params["config"].annotation is TaskConfig
+    )
+
+    # Identify special parameter names (*args, **kwargs, config, context)
+    var_arg_name: Optional[str] = None
+    kw_arg_name: Optional[str] = None
+    config_param_name: Optional[str] = None
+    context_param_name: Optional[str] = None
+
+    for name, param in params.items():
+        if param.annotation is TaskConfig:
+            config_param_name = name
+        elif name == "context" and param.annotation in (
+            Dict[str, Any],
+            dict,
+            Any,
+        ):
+            context_param_name = name
+        elif param.kind == param.VAR_POSITIONAL:
+            var_arg_name = name
+        elif param.kind == param.VAR_KEYWORD:
+            kw_arg_name = name
+
+    return (
+        params,
+        config_only,
+        var_arg_name,
+        kw_arg_name,
+        config_param_name,
+        context_param_name,
+    )
+
+
 def register_task(
     name: Optional[str] = None,
 ) -> Callable[..., Callable[[TaskConfig], R]]:
@@ -32,14 +95,17 @@ def register_task(
 
         @wraps(func)
         def wrapper(config: TaskConfig) -> R:
-            sig = inspect.signature(func)
-            params = sig.parameters
+            (
+                params,
+                config_only,
+                var_arg_name,
+                kw_arg_name,
+                config_param_name,
+                context_param_name,
+            ) = _task_signature(func)
 
             # Simplified Check: Handle tasks taking only TaskConfig first
-            if (
-                list(params.keys()) == ["config"]
-                and params["config"].annotation is TaskConfig
-            ):
+            if config_only:
                 return func(config)
 
             processed = config.process_inputs()
@@ -50,26 +116,6 @@ def register_task(
                 processed.copy()
             )  # Track inputs not mapped to named params
 
-            # Identify special parameter names (*args, **kwargs, config, context)
-            var_arg_name: Optional[str] = None
-            kw_arg_name: Optional[str] = None
-            config_param_name: Optional[str] = None
-            context_param_name: Optional[str] = None
-
-            for name, param in params.items():
-                if param.annotation is TaskConfig:
-                    config_param_name = name
-                elif name == "context" and param.annotation in (
-                    Dict[str, Any],
-                    dict,
-                    Any,
-                ):
-                    context_param_name = name
-                elif param.kind == param.VAR_POSITIONAL:
-                    var_arg_name = name
-                elif param.kind == param.VAR_KEYWORD:
-                    kw_arg_name = name
-
             # Map processed inputs to function arguments
             for name, param in params.items():
                 if name == config_param_name or name == context_param_name:
@@ -26,23 +26,31 @@ def get_task_logger(workspace: Union[str, Path], task_name: str) -> logging.Logg
     # Get logger for task
     logger = logging.getLogger(f"task.{task_name}")
 
-    # Logger is already configured if it has handlers
+    workspace_path = Path(workspace) if isinstance(workspace, str) else workspace
+    logs_dir = workspace_path / "logs"
+    log_file = os.path.abspath(logs_dir / f"{task_name}.log")
+
+    # Logger is already configured if its file handler targets this workspace
     if logger.handlers:
-        return logger
+        for handler in logger.handlers:
+            if (
+                isinstance(handler, logging.FileHandler)
+                and handler.baseFilename == log_file
+            ):
+                return logger
+        # Configured for another workspace: drop the stale handlers
+        for handler in logger.handlers[:]:
+            logger.removeHandler(handler)
+            handler.close()
 
     # Create formatters
     formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
-    # Create file handler
-    workspace_path = Path(workspace) if isinstance(workspace, str) else workspace
-    logs_dir = workspace_path / "logs"
+    # Create task-specific file handler; the file is opened on first record
     logs_dir.mkdir(parents=True, exist_ok=True)
-
-    # Create task-specific log file
-    log_file = logs_dir / f"{task_name}.log"
-    file_handler = logging.FileHandler(log_file)
+    file_handler = logging.FileHandler(log_file, encoding="utf-8", delay=True)
     file_handler.setFormatter(formatter)
     file_handler.setLevel(logging.DEBUG)
 
@@ -74,13 +82,18 @@ def log_task_execution(
         context: Workflow context
         workspace: Workspace directory
     """
+    # Skip building the messages (the context can be large) when filtered out
+    if not logger.isEnabledFor(logging.INFO):
+        return
+
     task_name = step.get("name", "unnamed_task")
     task_type = step.get("task", "unknown")  # Changed from "type" to "task"
 
     logger.info(f"Executing task '{task_name}' of type '{task_type}'")
-    logger.debug(f"Step configuration: {step}")
-    logger.debug(f"Context: {context}")
-    logger.debug(f"Workspace: {workspace}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Step configuration: {step}")
+        logger.debug(f"Context: {context}")
+        logger.debug(f"Workspace: {workspace}")
 
 
 def log_task_result(logger: logging.Logger, result: Any) -> None:
@@ -92,7 +105,8 @@ def log_task_result(logger: logging.Logger, result: Any) -> None:
         result: Task result
     """
     logger.info("Task completed successfully")
-    logger.debug(f"Result: {result}")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(f"Result: {result}")
 
 
 def log_task_error(logger: logging.Logger, error: Exception) -> None:
@@ -3,10 +3,11 @@ Batch processing task for handling multiple items in parallel.
 """
 
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, cast
+from queue import SimpleQueue
+from typing import Any, Callable, Dict, List, Tuple, cast
 
 from ..exceptions import TaskExecutionError
 from . import TaskConfig, get_task_handler, register_task
@@ -216,51 +217,68 @@ def batch_task(config: TaskConfig) -> Dict[str, Any]:
         ordered_processed: List[Tuple[int, Any]] = []
         ordered_failed: List[Tuple[int, Dict[str, Any]]] = []
 
-        # Process items in chunks
-        for chunk_index, chunk_start in enumerate(range(0, len(items), chunk_size)):
-            chunk = cast(List[Any], items[chunk_start : chunk_start + chunk_size])
+        def run_item(item: Any, index: int, chunk_index: int) -> Any:
+            # Pass the sub-task config, not the main batch config inputs
+            return process_item(
+                item,
+                task_config,
+                config.context,
+                config.workspace,
+                arg_name,
+                chunk_index,
+                index,
+                len(items),
+                chunk_size,
+            )
 
+        def record(item: Any, index: int, get_result: Callable[[], Any]) -> None:
+            try:
+                result = get_result()
+                ordered_processed.append((index, item))
+                ordered_results.append((index, result))
+                state["stats"]["processed"] += 1
+            except (
+                Exception
+            ) as e:  # noqa: BLE001 - broad catch required: futures may propagate arbitrary user task errors
+                # Capture the error from process_item (already wrapped if needed)
+                error_info = {"item": item, "error": str(e)}
+                # If it's a TaskExecutionError, add more details if possible
+                if isinstance(e, TaskExecutionError):
+                    error_info["step_name"] = e.step_name
+                    if e.task_config:
+                        error_info["task_config"] = e.task_config
+                ordered_failed.append((index, error_info))
+                state["stats"]["failed"] += 1
+
+        if len(items) == 1:
+            # A lone item runs on the calling thread; a pool would only add
+            # thread start-up and future bookkeeping
+            record(items[0], 0, lambda: run_item(items[0], 0, 0))
+        else:
+            # Process items in chunks, reusing one pool for the whole batch
+            done: "SimpleQueue[Future[Any]]" = SimpleQueue()
             with ThreadPoolExecutor(max_workers=max_workers) as executor:
-                futures = {}
-
-                # Submit tasks for chunk
-                for item_index, item in enumerate(chunk):
-                    # Pass the sub-task config, not the main batch config inputs
-                    sub_task_config_for_item = task_config
-                    future = executor.submit(
-                        process_item,
-                        item,  # item: Any
-                        sub_task_config_for_item,  # task_config: Dict[str, Any]
-                        config.context,  # context: Dict[str, Any]
-                        config.workspace,  # workspace: Path
-                        arg_name,  # arg_name: str
-                        chunk_index,  # chunk_index: int
-                        chunk_start + item_index,  # item_index: int
-                        len(items),  # total: int
-                        chunk_size,  # chunk_size: int
+                for chunk_index, chunk_start in enumerate(
+                    range(0, len(items), chunk_size)
+                ):
+                    chunk = cast(
+                        List[Any], items[chunk_start : chunk_start + chunk_size]
                     )
-                    futures[future] = (item, chunk_start + item_index)
-
-                # Process completed futures
-                for future in as_completed(futures):
-                    item, index = futures[future]
-                    try:
-                        result = future.result()
-                        ordered_processed.append((index, item))
-                        ordered_results.append((index, result))
-                        state["stats"]["processed"] += 1
-                    except (
-                        Exception
-                    ) as e:  # noqa: BLE001 - broad catch required: futures may propagate arbitrary user task errors
-                        # Capture the error from process_item (already wrapped if needed)
-                        error_info = {"item": item, "error": str(e)}
-                        # If it's a TaskExecutionError, add more details if possible
-                        if isinstance(e, TaskExecutionError):
-                            error_info["step_name"] = e.step_name
-                            if e.task_config:
-                                error_info["task_config"] = e.task_config
-                        ordered_failed.append((index, error_info))
-                        state["stats"]["failed"] += 1
+
+                    # Submit tasks for chunk; each future reports itself on the
+                    # completion queue once it finishes
+                    futures = {}
+                    for item_index, item in enumerate(chunk):
+                        index = chunk_start + item_index
+                        future = executor.submit(run_item, item, index, chunk_index)
+                        futures[future] = (item, index)
+                        future.add_done_callback(done.put)
+
+                    # Process completed futures
+                    for _ in range(len(futures)):
+                        future = done.get()
+                        item, index = futures[future]
+                        record(item, index, future.result)
 
         # Sort results by index and extract values
         state["processed"] = [item for _, item in sorted(ordered_processed)]
@@ -9,9 +9,13 @@ from typing import Any, Dict, List, Optional
 from jinja2 import UndefinedError
 
 from ..exceptions import TaskExecutionError, TemplateError
-from ..template import TemplateEngine
+from ..template import AttrDict, TemplateEngine
 from .error_handling import ErrorContext, handle_task_error
 
+# Shared by all task configs so compiled templates are reused across steps and
+# batch items; rendering with a Jinja environment is thread-safe
+_template_engine = TemplateEngine()
+
 
 class TaskConfig:
     """Configuration class for task handlers with namespace support."""
@@ -32,7 +36,8 @@ class TaskConfig:
         self._context = context
         self.workspace = workspace
         self._processed_inputs: Dict[str, Any] = {}
-        self._template_engine = TemplateEngine()
+        self._resolved_inputs: Dict[str, Any] = {}
+        self._template_engine = _template_engine
 
     @property
     def context(self) -> Dict[str, Any]:
@@ -90,28 +95,62 @@ class TaskConfig:
             Dict[str, Any]: Processed inputs with resolved templates
         """
         if not self._processed_inputs:
-            # Create a flattened context for template processing
-            template_context = {
-                "args": self._context.get("args", {}),
-                "env": self._context.get("env", {}),
-                "steps": self._context.get("steps", {}),
-                **{
-                    k: v
-                    for k, v in self._context.items()
-                    if k not in ["args", "env", "steps"]
-                },
-            }
-
-            self._processed_inputs = self._process_value(self.inputs, template_context)
+            self._processed_inputs = self._process_value(
+                self.inputs, self._template_context()
+            )
         return self._processed_inputs
 
-    def _process_value(self, value: Any, template_context: Dict[str, Any]) -> Any:
+    def get_input(self, name: str, default: Any = None) -> Any:
+        """
+        Get a single input with template resolution.
+
+        Only the requested input is rendered (and cached), so tasks that
+        read a few known keys skip rendering the ones they never use.
+
+        Args:
+            name: Input name
+            default: Value returned when the input is not set
+
+        Returns:
+            Any: Processed input value, or ``default``
+        """
+        if self._processed_inputs:
+            return self._processed_inputs.get(name, default)
+        if name not in self.inputs:
+            return default
+        if name not in self._resolved_inputs:
+            self._resolved_inputs[name] = self._process_value(
+                self.inputs[name], self._template_context()
+            )
+        return self._resolved_inputs[name]
+
+    def _template_context(self) -> Dict[str, Any]:
+        """Create a flattened context for template processing."""
+        return {
+            "args": self._context.get("args", {}),
+            "env": self._context.get("env", {}),
+            "steps": self._context.get("steps", {}),
+            **{
+                k: v
+                for k, v in self._context.items()
+                if k not in ["args", "env", "steps"]
+            },
+        }
+
+    def _process_value(
+        self,
+        value: Any,
+        template_context: Dict[str, Any],
+        context_cache: Optional[Dict[int, AttrDict]] = None,
+    ) -> Any:
         """
         Recursively process a value with template resolution.
 
         Args:
             value: Value to process
             template_context: Template context for variable resolution
+            context_cache: Wrapped template context shared by all leaves of
+                one input tree (created on the outermost call)
 
         Returns:
             Any: Processed value with resolved templates
@@ -119,15 +158,31 @@ class TaskConfig:
         Raises:
             TaskExecutionError: If template processing fails due to undefined variables.
         """
+        if context_cache is None:
+            context_cache = {}
         if isinstance(value, str):
             try:
-                result = self._template_engine.process_template(value, template_context)
+                result = self._template_engine.process_template(
+                    value, template_context, context_cache=context_cache
+                )
                 # Try to convert string results back to their original type
                 if result == "True":
                     return True
                 elif result == "False":
                     return False
                 try:
+                    # Plain integers and decimals are by far the most common
+                    # literals; convert them without going through the parser
+                    if isinstance(result, str):
+                        try:
+                            return int(result)
+                        except ValueError:
+                            if "." in result:
+                                try:
+                                    return float(result)
+                                except ValueError:
+                                    pass
+
                     # First try to evaluate as a Python literal (for lists, dicts, etc.)
                     import ast
 
@@ -152,10 +207,14 @@ class TaskConfig:
                 handle_task_error(context)
         elif isinstance(value, dict):
             return {
-                k: self._process_value(v, template_context) for k, v in value.items()
+                k: self._process_value(v, template_context, context_cache)
+                for k, v in value.items()
             }
         elif isinstance(value, list):
-            return [self._process_value(item, template_context) for item in value]
+            return [
+                self._process_value(item, template_context, context_cache)
+                for item in value
+            ]
         return value
 
     def _get_undefined_namespace(self, error_msg: str) -> str:
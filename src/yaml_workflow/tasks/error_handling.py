@@ -47,7 +47,11 @@ def handle_task_error(context: ErrorContext) -> None:
             f"Invalid or missing 'workspace' in task_config for step '{context.step_name}'. Defaulting to '.'"
         )
 
-    logger = get_task_logger(workspace, context.step_name)
+    # Without an explicit workspace, keep logging wherever the task's own
+    # logger already writes instead of rebinding it to the current directory
+    logger = logging.getLogger(f"task.{context.step_name}")
+    if workspace != "." or not logger.handlers:
+        logger = get_task_logger(workspace, context.step_name)
     log_task_error(logger, context.error)
 
     if isinstance(context.error, TaskExecutionError):
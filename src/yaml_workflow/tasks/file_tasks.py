@@ -2,21 +2,34 @@
 File operation tasks for working with files and directories.
 """
 
+import copy
+import errno
+import functools
 import json
+import mmap
 import os
 import shutil
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 import yaml
-from jinja2 import StrictUndefined, Template, UndefinedError
+from jinja2 import UndefinedError
 
 from ..exceptions import TaskExecutionError, TemplateError
+from ..template import compile_template
+from ..utils.yaml_utils import FastSafeLoader
 from ..workspace import resolve_path
 from . import TaskConfig, register_task
 from .base import get_task_logger, log_task_error, log_task_execution, log_task_result
 from .error_handling import ErrorContext, handle_task_error
 
+# libyaml-backed dumper when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as FastSafeDumper
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as FastSafeDumper  # type: ignore[assignment]
+
 
 def ensure_directory(file_path: Path, step_name: str) -> None:
     """
@@ -29,18 +42,172 @@ def ensure_directory(file_path: Path, step_name: str) -> None:
     Raises:
         TaskExecutionError: If directory cannot be created
     """
+    parent = file_path.parent
+    # Common case: one stat instead of mkdir failing with EEXIST plus a stat
+    if os.path.isdir(parent):
+        return
     try:
-        file_path.parent.mkdir(parents=True, exist_ok=True)
+        parent.mkdir(parents=True, exist_ok=True)
     except OSError as e:
         raise TaskExecutionError(step_name=step_name, original_error=e)
 
 
+def _parse(fmt: str, content: str) -> Any:
+    """Parse ``content`` as ``"json"`` or ``"yaml"``."""
+    if fmt == "json":
+        return json.loads(content)
+    return yaml.load(content, Loader=FastSafeLoader)
+
+
+_O_BINARY = getattr(os, "O_BINARY", 0)
+
+
+def _write_bytes(path: Path, data: bytes, append: bool = False) -> None:
+    """Write ``data`` to ``path`` using raw fd writes.
+
+    Replaces the file contents, or adds to the end when ``append`` is true.
+    """
+    mode = os.O_APPEND if append else os.O_TRUNC
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | mode | _O_BINARY, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+# Files above this size are decoded straight from a memory map
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _read_text(path: Path, encoding: str) -> str:
+    """Read and decode all of ``path``.
+
+    Small files take a single ``os.read``; large ones are decoded directly
+    from a read-only memory map, skipping the intermediate ``bytes`` copy.
+    Files that cannot be mapped (FUSE, procfs, some network filesystems)
+    are read with plain ``os.read`` calls instead.
+    """
+    fd = os.open(path, os.O_RDONLY | _O_BINARY)
+    try:
+        size = os.fstat(fd).st_size
+        if size > _MMAP_THRESHOLD:
+            try:
+                mm = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                pass
+            else:
+                with mm:
+                    return str(mm, encoding)
+        data = os.read(fd, size + 1)
+        if len(data) == size:
+            return data.decode(encoding)
+        # Short read, a file that grew, or one whose size is not reported
+        # (e.g. procfs): keep reading until EOF
+        chunks = [data]
+        while chunk := os.read(fd, 65536):
+            chunks.append(chunk)
+        return b"".join(chunks).decode(encoding)
+    finally:
+        os.close(fd)
+
+
+# copy_file_range errors meaning "not supported here" rather than a real failure
+_COPY_RANGE_UNSUPPORTED = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP}
+)
+_COPY_BUFSIZE = 1024 * 1024
+_copy_scratch = threading.local()
+
+
+def _copy_buffer() -> memoryview:
+    """Per-thread reusable buffer for the copy fallback."""
+    buf = getattr(_copy_scratch, "buf", None)
+    if buf is None:
+        buf = _copy_scratch.buf = memoryview(bytearray(_COPY_BUFSIZE))
+    return buf
+
+
+def _copy_file_data(source_path: Path, dest_path: Path) -> None:
+    """Copy file contents, letting the kernel move the bytes when it can.
+
+    Uses ``os.copy_file_range`` (which also allows reflinks on filesystems
+    that support them) and falls back to a buffered copy where it is not
+    available or copies nothing.
+    """
+    if not hasattr(os, "copy_file_range"):
+        shutil.copyfile(source_path, dest_path)
+        return
+    if dest_path.exists() and os.path.samefile(source_path, dest_path):
+        raise shutil.SameFileError(
+            f"{source_path!r} and {dest_path!r} are the same file"
+        )
+    with open(source_path, "rb") as fsrc, open(dest_path, "wb") as fdst:
+        copied = 0
+        try:
+            while True:
+                n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), 1 << 30)
+                if n == 0:
+                    if copied:
+                        return
+                    # Some filesystems (procfs, sysfs, FUSE, older kernels)
+                    # report 0 without copying anything
+                    break
+                copied += n
+        except OSError as e:
+            if copied or e.errno not in _COPY_RANGE_UNSUPPORTED:
+                raise
+        buf = _copy_buffer()
+        while n := fsrc.readinto(buf):
+            fdst.write(buf[:n])
+
+
+# Parsed read_yaml results, keyed on the file's stat signature. YAML parsing
+# costs roughly 10x a deepcopy of the result, so a hit is a net win; JSON
+# parses faster than it deep-copies and is never cached.
+_PARSED_CACHE_SIZE = 128
+
+
+@functools.lru_cache(maxsize=_PARSED_CACHE_SIZE)
+def _load_yaml(path: str, mtime_ns: int, size: int, encoding: str) -> Any:
+    """Read and parse ``path`` as YAML.
+
+    ``mtime_ns`` and ``size`` are only part of the cache key, so a file that
+    changed on disk is parsed again. A rewrite from outside this module (e.g.
+    a shell or python step) that keeps the same size and lands within the
+    filesystem's timestamp granularity can still return the previous content.
+    """
+    return _parse("yaml", read_file_direct(path, Path(path).parent, encoding))
+
+
+def _read_yaml_cached(file_path: str, workspace: Path, encoding: str) -> Any:
+    """Return a private copy of the parsed YAML content of ``file_path``."""
+    resolved_path = resolve_path(workspace, file_path).absolute()
+    try:
+        st = os.stat(resolved_path)
+    except OSError:
+        # Let read_file_direct report the missing/unreadable file
+        return _parse("yaml", read_file_direct(file_path, workspace, encoding))
+    data = _load_yaml(str(resolved_path), st.st_mtime_ns, st.st_size, encoding)
+    return copy.deepcopy(data)
+
+
+def _invalidate_parsed_cache() -> None:
+    """Drop cached parse results after a write from this module.
+
+    Guards against a rewrite landing within the filesystem's timestamp
+    granularity with an unchanged size.
+    """
+    _load_yaml.cache_clear()
+
+
 # Direct file operations
 
 
 def write_file_direct(
     file_path: str,
-    content: str,
+    content: Union[str, bytes],
     workspace: Path,
     encoding: str = "utf-8",
     step_name: str = "write_file",
@@ -49,7 +216,7 @@ def write_file_direct(
 
     Args:
         file_path: Path to the file
-        content: Content to write
+        content: Content to write; bytes are written as-is
         workspace: Workspace directory
         encoding: File encoding (default: utf-8)
         step_name: Name of the step for error reporting
@@ -63,8 +230,9 @@ def write_file_direct(
     try:
         resolved_path = resolve_path(workspace, file_path)
         ensure_directory(resolved_path, step_name)
-        with open(resolved_path, "wb") as f:
-            f.write(content.encode(encoding))
+        data = content if isinstance(content, bytes) else content.encode(encoding)
+        _write_bytes(resolved_path, data)
+        _invalidate_parsed_cache()
         return str(resolved_path)
     except (IOError, UnicodeEncodeError) as e:
         raise TaskExecutionError(step_name=step_name, original_error=e)
@@ -95,29 +263,27 @@ def read_file_direct(
     try:
         if logger:
             logger.debug(f"Original file_path={file_path}")
-            logger.debug(f"Workspace={workspace}, exists={workspace.exists()}")
+            logger.debug(f"Workspace={workspace}")
 
         resolved_path = resolve_path(workspace, file_path)
 
         if logger:
-            logger.debug(
-                f"Resolved path={resolved_path}, exists={resolved_path.exists()}"
-            )
-            if not resolved_path.exists():
-                parent_dir = resolved_path.parent
+            logger.debug(f"Resolved path={resolved_path}")
+
+        content = _read_text(resolved_path, encoding)
+        if logger:
+            logger.debug(f"Successfully read {len(content)} bytes from file")
+        return content
+    except (IOError, UnicodeDecodeError) as e:
+        if logger:
+            if isinstance(e, FileNotFoundError) and e.filename:
+                # Only stat around the path once the read has actually failed
+                parent_dir = Path(e.filename).parent
                 logger.debug(
                     f"Parent directory={parent_dir}, exists={parent_dir.exists()}"
                 )
                 if parent_dir.exists():
                     logger.debug(f"Directory contents: {list(parent_dir.glob('*'))}")
-
-        with open(resolved_path, "rb") as f:
-            content = f.read().decode(encoding)
-            if logger:
-                logger.debug(f"Successfully read {len(content)} bytes from file")
-            return content
-    except (IOError, UnicodeDecodeError) as e:
-        if logger:
             logger.error(f"ERROR: {type(e).__name__}: {str(e)}")
             import traceback
 
@@ -150,8 +316,8 @@ def append_file_direct(
     try:
         resolved_path = resolve_path(workspace, file_path)
         ensure_directory(resolved_path, step_name)
-        with open(resolved_path, "a", encoding=encoding) as f:
-            f.write(content)
+        _write_bytes(resolved_path, content.encode(encoding), append=True)
+        _invalidate_parsed_cache()
         return str(resolved_path)
     except (IOError, UnicodeEncodeError) as e:
         raise TaskExecutionError(step_name=step_name, original_error=e)
@@ -178,7 +344,10 @@ def copy_file_direct(
         source_path = resolve_path(workspace, source)
         dest_path = resolve_path(workspace, destination)
         ensure_directory(dest_path, step_name)
-        shutil.copy2(source_path, dest_path)
+        target = dest_path / source_path.name if dest_path.is_dir() else dest_path
+        _copy_file_data(source_path, target)
+        shutil.copystat(source_path, target)
+        _invalidate_parsed_cache()
         return str(dest_path)
     except (IOError, shutil.Error) as e:
         raise TaskExecutionError(step_name=step_name, original_error=e)
@@ -205,7 +374,20 @@ def move_file_direct(
         source_path = resolve_path(workspace, source)
         dest_path = resolve_path(workspace, destination)
         ensure_directory(dest_path, step_name)
-        shutil.move(str(source_path), str(dest_path))
+        target = dest_path
+        if dest_path.is_dir():
+            target = dest_path / source_path.name
+            # Same refusal as shutil.move: never clobber a file inside a directory
+            if os.path.lexists(target):
+                raise shutil.Error(f"Destination path '{target}' already exists")
+        try:
+            # Single rename when both paths are on the same filesystem
+            os.replace(source_path, target)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(source_path), str(dest_path))
+        _invalidate_parsed_cache()
         return str(dest_path)
     except (IOError, shutil.Error) as e:
         raise TaskExecutionError(step_name=step_name, original_error=e)
@@ -229,8 +411,8 @@ def delete_file_direct(
     """
     try:
         resolved_path = resolve_path(workspace, file_path)
-        if resolved_path.exists():
-            resolved_path.unlink()
+        resolved_path.unlink(missing_ok=True)
+        _invalidate_parsed_cache()
         return str(resolved_path)
     except IOError as e:
         raise TaskExecutionError(step_name=step_name, original_error=e)
@@ -247,10 +429,9 @@ def write_file_task(config: TaskConfig) -> Optional[Dict[str, Any]]:
     logger = get_task_logger(config.workspace, task_name)
     log_task_execution(logger, config.step, config.context, config.workspace)
     try:
-        processed = config.process_inputs()
-        file_path = processed.get("file")
-        content = processed.get("content")
-        encoding = processed.get("encoding", "utf-8")
+        file_path = config.get_input("file")
+        content = config.get_input("content")
+        encoding = config.get_input("encoding", "utf-8")
 
         if not file_path:
             raise ValueError("No file path provided")
@@ -283,36 +464,21 @@ def read_file_task(config: TaskConfig) -> Optional[Dict[str, Any]]:
     logger = get_task_logger(config.workspace, task_name)
     log_task_execution(logger, config.step, config.context, config.workspace)
     try:
-        processed = config.process_inputs()
-        file_path_input = processed.get("file")
+        file_path_input = config.get_input("file")
 
         # Debug logging
-        logger.debug(
-            f"Workspace={config.workspace}, exists={config.workspace.exists()}"
-        )
         logger.debug(f"file_path param={file_path_input}")
-        logger.debug(f"All inputs={processed}")
+        logger.debug(f"All inputs={config.inputs}")
 
-        encoding = processed.get("encoding", "utf-8")
+        encoding = config.get_input("encoding", "utf-8")
 
         if not file_path_input:
             error_msg = "No file path provided (param 'file' is missing)"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-        # Debug: Print resolved path
-        resolved_path = str(resolve_path(config.workspace, file_path_input))
-        logger.debug(f"Resolved path={resolved_path}")
-
-        # Check if file exists before trying to read it
-        resolved_file = Path(resolved_path)
-        logger.debug(f"File exists={resolved_file.exists()}")
-        if not resolved_file.exists():
-            parent_dir = resolved_file.parent
-            logger.debug(f"Parent directory={parent_dir}, exists={parent_dir.exists()}")
-            if parent_dir.exists():
-                logger.debug(f"Directory contents: {list(parent_dir.glob('*'))}")
-
+        # read_file_direct logs the resolved path, and the parent directory
+        # contents if the file turns out to be missing
         content = read_file_direct(
             file_path_input, config.workspace, encoding, task_name, logger=logger
         )
@@ -351,10 +517,9 @@ def append_file_task(config: TaskConfig) -> Optional[Dict[str, Any]]:
     logger = get_task_logger(config.workspace, task_name)
     log_task_execution(logger, config.step, config.context, config.workspace)
     try:
-        processed = config.process_inputs()
-        file_path = processed.get("file")
-        content = processed.get("content")
-        encoding = processed.get("encoding", "utf-8")
+        file_path = config.get_input("file")
+        content = config.get_input("content")
+        encoding = config.get_input("encoding", "utf-8")
 
         if not file_path:
             raise ValueError("No file path provided")
@@ -393,9 +558,8 @@ def copy_file_task(config: TaskConfig) -> Optional[Dict[str, Any]]:
     logger = get_task_logger(config.workspace, task_name)
     log_task_execution(logger, config.step, config.context, config.workspace)
     try:
-        processed = config.process_inputs()
-        source = processed.get("source")
-        destination = processed.get("destination")
+        source = config.get_input("source")
+        destination = config.get_input("destination")
 
         if not source:
             raise ValueError("No source file provided")
@@ -426,9 +590,8 @@ def move_file_task(config: TaskConfig) -> Optional[Dict[str, Any]]:
     logger = get_task_logger(config.workspace, task_name)
     log_task_execution(logger, config.step, config.context, config.workspace)
     try:
-        processed = config.process_inputs()
-        source = processed.get("source")
-        destination = processed.get("destination")
+        source = config.get_input("source")
+        destination = config.get_input("destination")
 
         if not source:
             raise ValueError("No source file provided")
@@ -459,8 +622,7 @@ def delete_file_task(config: TaskConfig) -> Optional[Dict[str, Any]]:
     logger = get_task_logger(config.workspace, task_name)
     log_task_execution(logger, config.step, config.context, config.workspace)
     try:
-        processed = config.process_inputs()
-        file_path = processed.get("file")
+        file_path = config.get_input("file")
 
         if not file_path:
             raise ValueError("No file path provided")
@@ -490,9 +652,8 @@ def read_json_task(config: TaskConfig) -> Optional[Dict[str, Any]]:
     log_task_execution(logger, config.step, config.context, config.workspace)
 
     try:
-        processed = config.process_inputs()
-        file_path = processed.get("file")
-        encoding = processed.get("encoding", "utf-8")
+        file_path = config.get_input("file")
+        encoding = config.get_input("encoding", "utf-8")
 
         if not file_path:
             raise ValueError("No file path provided")
@@ -527,19 +688,15 @@ def write_json_task(config: TaskConfig) -> Optional[Dict[str, Any]]:
     logger = get_task_logger(config.workspace, task_name)
     log_task_execution(logger, config.step, config.context, config.workspace)
     try:
-        processed = config.process_inputs()
-        file_path = processed.get("file")
+        file_path = config.get_input("file")
 
-        # Debug: Print workspace and file path info
-        logger.debug(
-            f"Workspace={config.workspace}, exists={config.workspace.exists()}"
-        )
+        # Debug: Print file path info
         logger.debug(f"file_path param={file_path}")
-        logger.debug(f"All inputs={processed}")
+        logger.debug(f"All inputs={config.inputs}")
 
-        data = processed.get("data")
-        indent = int(processed.get("indent", 2))
-        encoding = processed.get("encoding", "utf-8")
+        data = config.get_input("data")
+        indent = int(config.get_input("indent", 2))
+        encoding = config.get_input("encoding", "utf-8")
 
         if not file_path:
             error_msg = "No file path provided (param 'file' is missing)"
@@ -550,18 +707,7 @@ def write_json_task(config: TaskConfig) -> Optional[Dict[str, Any]]:
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-        # Ensure output directory exists
-        if "output/" in file_path:
-            output_dir = config.workspace / "output"
-            logger.debug(
-                f"Creating output dir {output_dir}, exists={output_dir.exists()}"
-            )
-            output_dir.mkdir(exist_ok=True, parents=True)
-
-        # Debug: Print resolved path
-        resolved_path = str(resolve_path(config.workspace, file_path))
-        logger.debug(f"Resolved path={resolved_path}")
-
+        # write_json_direct resolves the path and creates missing directories
         result_path = write_json_direct(
             file_path,
             data,
@@ -572,10 +718,6 @@ def write_json_task(config: TaskConfig) -> Optional[Dict[str, Any]]:
             logger=logger,
         )
 
-        # Debug: Check if file was created
-        result_file = Path(result_path)
-        logger.debug(f"Result path={result_path}, exists={result_file.exists()}")
-
         output = {"path": result_path}
         log_task_result(logger, output)
         return output
@@ -606,9 +748,8 @@ def read_yaml_task(config: TaskConfig) -> Optional[Dict[str, Any]]:
     log_task_execution(logger, config.step, config.context, config.workspace)
 
     try:
-        processed = config.process_inputs()
-        file_path = processed.get("file")
-        encoding = processed.get("encoding", "utf-8")
+        file_path = config.get_input("file")
+        encoding = config.get_input("encoding", "utf-8")
 
         if not file_path:
             raise ValueError("No file path provided")
@@ -643,10 +784,9 @@ def write_yaml_task(config: TaskConfig) -> Optional[Dict[str, Any]]:
     logger = get_task_logger(config.workspace, task_name)
     log_task_execution(logger, config.step, config.context, config.workspace)
     try:
-        processed = config.process_inputs()
-        file_path = processed.get("file")
-        data = processed.get("data")
-        encoding = processed.get("encoding", "utf-8")
+        file_path = config.get_input("file")
+        data = config.get_input("data")
+        encoding = config.get_input("encoding", "utf-8")
 
         if not file_path:
             raise ValueError("No file path provided")
@@ -696,7 +836,7 @@ def process_templates(data: Any, context: Dict[str, Any]) -> Any:
     """
     if isinstance(data, str):
         try:
-            template = Template(data, undefined=StrictUndefined)
+            template = compile_template(data)
             return template.render(**context)
         except UndefinedError as e:
             available = {
@@ -732,8 +872,7 @@ def read_json(
         TaskExecutionError: If file cannot be read or JSON is invalid
     """
     try:
-        content = read_file_direct(file_path, workspace, encoding)
-        return json.loads(content)
+        return _parse("json", read_file_direct(file_path, workspace, encoding))
     except json.JSONDecodeError as e:
         raise TaskExecutionError(step_name="read_json", original_error=e)
 
@@ -767,30 +906,20 @@ def write_json_direct(
     try:
         if logger:
             logger.debug(f"Original file_path={file_path}")
-            logger.debug(f"Workspace={workspace}, exists={workspace.exists()}")
+            logger.debug(f"Workspace={workspace}")
 
         if workspace:
             file_path = str(resolve_path(workspace, file_path))
             if logger:
                 logger.debug(f"Resolved file_path={file_path}")
-                dir_path = Path(file_path).parent
-                logger.debug(f"Directory path={dir_path}, exists={dir_path.exists()}")
             ensure_directory(Path(file_path), step_name)
-            if logger:
-                dir_path = Path(file_path).parent
-                logger.debug(f"After ensure_directory, dir exists={dir_path.exists()}")
-
-        if logger:
-            logger.debug(f"Writing JSON to {file_path}")
-        with open(file_path, "w") as f:
-            json.dump(data, f, indent=indent)
 
-        # Verify file was created
+        # Serialize fully before touching the file, then write it in one go
+        payload = json.dumps(data, indent=indent).encode(encoding)
         if logger:
-            created_file = Path(file_path)
-            logger.debug(
-                f"File created, exists={created_file.exists()}, size={created_file.stat().st_size if created_file.exists() else 'N/A'}"
-            )
+            logger.debug(f"Writing {len(payload)} bytes of JSON to {file_path}")
+        _write_bytes(Path(file_path), payload)
+        _invalidate_parsed_cache()
 
         return file_path
     except (IOError, TypeError) as e:
@@ -819,8 +948,7 @@ def read_yaml(
         TaskExecutionError: If file cannot be read or YAML is invalid
     """
     try:
-        content = read_file_direct(file_path, workspace, encoding)
-        return yaml.safe_load(content)
+        return _read_yaml_cached(file_path, workspace, encoding)
     except yaml.YAMLError as e:
         raise TaskExecutionError(step_name="read_yaml", original_error=e)
 
@@ -852,8 +980,15 @@ def write_yaml_direct(
             file_path = str(resolve_path(workspace, file_path))
             ensure_directory(Path(file_path), step_name)
 
+        try:
+            text = yaml.dump(data, Dumper=FastSafeDumper, default_flow_style=False)
+        except yaml.representer.RepresenterError:
+            # Custom objects and other Python-specific types keep the full
+            # Dumper's tagged output, as before the switch to the safe dumper
+            text = yaml.dump(data, default_flow_style=False)
         with open(file_path, "w") as f:
-            yaml.dump(data, f, default_flow_style=False)
+            f.write(text)
+        _invalidate_parsed_cache()
         return file_path
     except (IOError, yaml.YAMLError) as e:
         raise TemplateError(f"Failed to write YAML file '{file_path}': {str(e)}")
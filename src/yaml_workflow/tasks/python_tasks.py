@@ -3,6 +3,7 @@ Python task implementations for executing Python functions.
 """
 
 import asyncio
+import functools
 import importlib
 import inspect
 import io
@@ -14,6 +15,7 @@ import sys
 import threading
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
+from types import CodeType
 from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from jinja2 import StrictUndefined, Template, UndefinedError
@@ -91,7 +93,13 @@ def print_message_task(config: TaskConfig) -> dict:
 def _load_function(module_name: str, function_name: str) -> Callable:
     """Load a function from a module."""
     try:
-        module = importlib.import_module(module_name)
+        # Already-imported modules skip the import machinery and its lock, but
+        # one still being imported by another thread must go through it
+        module = sys.modules.get(module_name)
+        if module is None or getattr(
+            getattr(module, "__spec__", None), "_initializing", False
+        ):
+            module = importlib.import_module(module_name)
         if not hasattr(module, function_name):
             raise AttributeError(
                 f"Function '{function_name}' not found in module '{module_name}'"
@@ -261,6 +269,12 @@ def _execute_module(
 _cwd_lock = threading.Lock()
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_code(code: str) -> CodeType:
+    """Compile a python_code snippet once; loops and batches reuse it."""
+    return compile(code, "<python_code>", "exec")
+
+
 def _execute_code(
     code: str, config: TaskConfig, result_variable: Optional[str] = None
 ) -> Any:
@@ -289,7 +303,7 @@ def _execute_code(
             try:
                 os.chdir(str(config.workspace))
                 with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                    exec(code, {}, exec_context)
+                    exec(_compile_code(code), {}, exec_context)
             finally:
                 os.chdir(old_cwd)
 
@@ -10,9 +10,10 @@ import subprocess
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
-from jinja2 import StrictUndefined, Template, TemplateSyntaxError, UndefinedError
+from jinja2 import TemplateSyntaxError, UndefinedError
 
 from ..exceptions import TaskExecutionError, TemplateError
+from ..template import compile_template
 from . import TaskConfig, register_task
 from .base import get_task_logger, log_task_error, log_task_execution, log_task_result
 from .error_handling import ErrorContext, handle_task_error
@@ -249,7 +250,7 @@ def process_command(command: str, context: Dict[str, Any]) -> str:
         TaskExecutionError: If template resolution fails (via handle_task_error)
     """
     try:
-        template = Template(command, undefined=StrictUndefined)
+        template = compile_template(command)
         return template.render(**context)
     except UndefinedError as e:
         task_name = context.get("step_name", "shell_template")
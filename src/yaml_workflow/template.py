@@ -1,7 +1,8 @@
 """Template engine implementation using Jinja2."""
 
 import re
-from typing import Any, Dict, Iterator, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 from jinja2 import Environment, StrictUndefined, Template
 from jinja2.exceptions import TemplateSyntaxError, UndefinedError
@@ -9,6 +10,16 @@ from jinja2.loaders import FileSystemLoader
 
 from .exceptions import TemplateError
 
+# Start of a Jinja expression, statement or comment
+_MARKUP_START = re.compile(r"\{[{%#]")
+
+
+@lru_cache(maxsize=256)
+def compile_template(source: str) -> Template:
+    """Compile a standalone strict template once; callers rendering the same
+    source repeatedly (loops, batches) reuse it."""
+    return Template(source, undefined=StrictUndefined)
+
 
 class AttrDict(dict):
     """A dictionary that allows attribute access to its keys."""
@@ -59,6 +70,25 @@ class TemplateEngine:
             trim_blocks=True,
             lstrip_blocks=True,
         )
+        # Compiled templates for the default environment, keyed by source, so
+        # the same input template rendered for many steps/items compiles once
+        self._compile = lru_cache(maxsize=512)(self.env.from_string)
+        # Environments for include search paths (e.g. each run's workspace),
+        # each paired with its own compile cache
+        self._search_env = lru_cache(maxsize=32)(self._make_search_env)
+
+    def _make_search_env(
+        self, searchpath: str
+    ) -> Tuple[Environment, Callable[[str], Template]]:
+        """Create the environment used to render templates with includes."""
+        env = Environment(
+            loader=FileSystemLoader(searchpath=searchpath),
+            undefined=StrictUndefined,
+            autoescape=False,
+            trim_blocks=True,
+            lstrip_blocks=True,
+        )
+        return env, lru_cache(maxsize=512)(env.from_string)
 
     def _extract_variable_path(self, template_str: str, error_msg: str) -> str:
         """Extract the full variable path from the template string.
@@ -94,6 +124,7 @@ class TemplateEngine:
         template_str: str,
         variables: Optional[Dict[str, Any]] = None,
         searchpath: Optional[str] = None,
+        context_cache: Optional[Dict[int, AttrDict]] = None,
     ) -> Any:
         """Process a template string with the given variables.
 
@@ -102,6 +133,9 @@ class TemplateEngine:
             variables (Optional[Dict[str, Any]], optional): Variables to use in template processing.
                 Defaults to None.
             searchpath (Optional[str], optional): Filesystem path for includes/extends. Defaults to None.
+            context_cache (Optional[Dict[int, AttrDict]], optional): Wrapped variables shared by
+                calls rendering against the same, unchanged variables (e.g. every leaf of one
+                input tree), so they are converted to an AttrDict once. Defaults to None.
 
         Returns:
             Any: The processed template value, preserving the original type.
@@ -113,17 +147,20 @@ class TemplateEngine:
             # Initialize variables to empty dict if None
             vars_dict: Dict[str, Any] = variables if variables is not None else {}
 
-            # Choose environment: Create a new one if searchpath is provided
+            # Text without any Jinja markup renders to itself, apart from the
+            # single trailing newline Jinja drops, so skip compile and render
+            if "\r" not in template_str and (
+                "{" not in template_str or not _MARKUP_START.search(template_str)
+            ):
+                if template_str.endswith("\n"):
+                    return template_str[:-1]
+                return template_str
+
+            # Choose environment: one with a loader if searchpath is provided
             if searchpath:
-                env = Environment(
-                    loader=FileSystemLoader(searchpath=searchpath),
-                    undefined=StrictUndefined,
-                    autoescape=False,
-                    trim_blocks=True,
-                    lstrip_blocks=True,
-                )
+                _, compile_template = self._search_env(searchpath)
             else:
-                env = self.env  # Use default env if no searchpath
+                compile_template = self._compile  # Use default env if no searchpath
 
             # If the template is just a variable reference, try to return the raw value
             if template_str.strip().startswith("{{") and template_str.strip().endswith(
@@ -141,10 +178,16 @@ class TemplateEngine:
                         return current
 
             # Create a template using the chosen environment
-            template = env.from_string(template_str)
+            template = compile_template(template_str)
 
             # Convert variables to AttrDict for proper attribute access
-            context = AttrDict(vars_dict)
+            if context_cache is None:
+                context = AttrDict(vars_dict)
+            else:
+                cached: Optional[AttrDict] = context_cache.get(id(vars_dict))
+                if cached is None:
+                    cached = context_cache[id(vars_dict)] = AttrDict(vars_dict)
+                context = cached
 
             # Process the template with the wrapped variables
             return template.render(**context)
@@ -222,10 +265,18 @@ class TemplateEngine:
         Returns:
             Any: The processed value
         """
+        return self._process_value(value, variables, {})
+
+    def _process_value(
+        self, value: Any, variables: Dict[str, Any], cache: Dict[int, AttrDict]
+    ) -> Any:
+        """Walk ``value``, wrapping ``variables`` at most once for all its leaves."""
         if isinstance(value, str):
-            return self.process_template(value, variables)
+            return self.process_template(value, variables, context_cache=cache)
         elif isinstance(value, dict):
-            return {k: self.process_value(v, variables) for k, v in value.items()}
+            return {
+                k: self._process_value(v, variables, cache) for k, v in value.items()
+            }
         elif isinstance(value, list):
-            return [self.process_value(item, variables) for item in value]
+            return [self._process_value(item, variables, cache) for item in value]
         return value
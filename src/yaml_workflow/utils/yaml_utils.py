@@ -1,17 +1,48 @@
 """YAML utilities for the workflow engine."""
 
+import io
 from typing import Any
 
 import yaml
 
+# libyaml-backed loader when PyYAML was built with it, otherwise the
+# pure-Python equivalent.
+try:
+    from yaml import CSafeLoader as FastSafeLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeLoader as FastSafeLoader  # type: ignore[assignment]
+
 
 def raw_constructor(loader: yaml.SafeLoader, node: yaml.ScalarNode) -> str:
     """Constructor for !raw tag that preserves raw string content."""
     return loader.construct_scalar(node)
 
 
-def get_safe_loader() -> type[yaml.SafeLoader]:
-    """Get a SafeLoader with custom constructors registered."""
-    loader = yaml.SafeLoader
-    loader.add_constructor("!raw", raw_constructor)
-    return loader
+class WorkflowLoader(FastSafeLoader):  # type: ignore[valid-type,misc]
+    """Safe loader for workflow files, libyaml-backed when available."""
+
+
+WorkflowLoader.add_constructor("!raw", raw_constructor)
+
+
+def get_safe_loader() -> type:
+    """Get a safe loader with custom constructors registered."""
+    # Keep !raw available to plain yaml.safe_load() callers as before
+    yaml.SafeLoader.add_constructor("!raw", raw_constructor)
+    return WorkflowLoader
+
+
+def load_workflow_yaml(data: bytes, name: str) -> Any:
+    """Parse a workflow document with the fast loader.
+
+    On a syntax error the document is parsed again, from a stream named
+    ``name``, with the pure-Python loader, so the error raised points at the
+    file and reads the same whether or not libyaml is available.
+    """
+    loader = get_safe_loader()
+    try:
+        return yaml.load(data, Loader=loader)
+    except yaml.YAMLError:
+        stream = io.BytesIO(data)
+        stream.name = name  # type: ignore[attr-defined]
+        return yaml.load(stream, Loader=yaml.SafeLoader)
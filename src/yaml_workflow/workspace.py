@@ -7,7 +7,7 @@ import os
 import re
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Dict, List, Optional, Set, cast
 
 from yaml_workflow.exceptions import WorkflowError
 
@@ -122,7 +122,7 @@ def create_workspace(
         Path: Path to the workspace directory
     """
     base_path = Path(base_dir)
-    base_path.mkdir(exist_ok=True)
+    base_path.mkdir(parents=True, exist_ok=True)
 
     sanitized_name = sanitize_name(workflow_name)
 
@@ -248,6 +248,10 @@ class BatchState:
             },
         }
 
+        # Set view of state["processed"] so marking an item is not a list scan
+        self._processed_keys: Set[str] = set()
+        self._indexed_list: Optional[List[str]] = None
+
         # Load existing state if available
         if self.state_file.exists():
             self._load_state()
@@ -273,8 +277,16 @@ class BatchState:
             result: Processing result
         """
         processed_items = cast(List[str], self.state["processed"])
-        if str(item) not in processed_items:
-            processed_items.append(str(item))
+        if processed_items is not self._indexed_list or len(processed_items) != len(
+            self._processed_keys
+        ):
+            # The list was loaded, reset or edited directly; index it again
+            self._processed_keys = set(processed_items)
+            self._indexed_list = processed_items
+        key = str(item)
+        if key not in self._processed_keys:
+            self._processed_keys.add(key)
+            processed_items.append(key)
             self.state["stats"]["processed"] += 1
 
     def mark_failed(self, item: Any, error: str) -> None:
@@ -1,3 +1,4 @@
+import itertools
 import json
 import logging
 import os
@@ -20,6 +21,10 @@ def _close_all_log_handlers():
 
     On Windows, open file handles prevent temp directory cleanup.
     This must be called before any TemporaryDirectory context exits.
+
+    Plain console handlers are dropped too: they hold on to whatever
+    ``sys.stderr`` was when they were created, which under ``capsys`` is a
+    capture buffer that pytest closes at the end of the test.
     """
     for logger_name in list(logging.Logger.manager.loggerDict.keys()) + [""]:
         logger = logging.getLogger(logger_name)
@@ -27,6 +32,8 @@ def _close_all_log_handlers():
             if isinstance(handler, logging.FileHandler):
                 handler.close()
                 logger.removeHandler(handler)
+            elif type(handler) is logging.StreamHandler:
+                logger.removeHandler(handler)
 
 
 # Add the src directory to Python path
@@ -38,6 +45,64 @@ TESTS_DIR = Path(__file__).parent
 PROJECT_ROOT = TESTS_DIR.parent
 EXAMPLES_DIR = PROJECT_ROOT / "src" / "yaml_workflow" / "examples"
 
+# Upper bound on how much of each workflow log is attached to a failure report
+MAX_ATTACHED_LOG_CHARS = 65536
+
+# RAM-backed scratch space for temp_workspace when available (Linux); None
+# falls back to the platform default temp directory.
+_SHM_DIR = "/dev/shm"
+TMPFS_ROOT = (
+    _SHM_DIR
+    if os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK | os.X_OK)
+    else None
+)
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow (e.g. subprocess smoke tests)",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--runslow"):
+        return
+    skip_slow = pytest.mark.skip(reason="need --runslow option to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Expose phase reports on the item and attach workflow logs on failure.
+
+    Workspaces registered through the ``attach_on_fail`` fixture have the tail
+    of each ``*.log`` file added to the failing test's report, so nothing is
+    read or printed when the test passes.
+    """
+    outcome = yield
+    rep = outcome.get_result()
+    setattr(item, f"rep_{rep.when}", rep)
+    if rep.when != "call" or not rep.failed:
+        return
+    for workspace in getattr(item, "_workflow_workspaces", ()):
+        for log_file in sorted(Path(workspace).rglob("*.log")):
+            content = log_file.read_text(encoding="utf-8", errors="replace")
+            rep.sections.append(
+                (f"workflow log {log_file.name}", content[-MAX_ATTACHED_LOG_CHARS:])
+            )
+
+
+@pytest.fixture
+def attach_on_fail(request):
+    """Register workspace directories whose logs are reported if the test fails."""
+    request.node._workflow_workspaces = []
+    return request.node._workflow_workspaces.append
+
 
 @pytest.fixture(autouse=True)
 def _cleanup_log_handlers():
@@ -51,17 +116,60 @@ def _cleanup_log_handlers():
     _close_all_log_handlers()
 
 
+@pytest.fixture(scope="session")
+def _ws_root():
+    """Session-wide parent directory for every ``temp_workspace``.
+
+    Lives on tmpfs (``/dev/shm``) when available, so file task tests do not
+    pay for disk writeback. Each workspace removes itself on teardown; the
+    root is removed at the end of the session.
+    """
+    root = Path(tempfile.mkdtemp(prefix="pytest-yaml-workflow-", dir=TMPFS_ROOT))
+    yield root
+    # Close log file handlers before removing the tree — Windows can't
+    # delete open files
+    _close_all_log_handlers()
+    shutil.rmtree(root, ignore_errors=True)
+
+
+_ws_counter = itertools.count()
+
+
 @pytest.fixture
-def temp_workspace():
-    """Create a temporary workspace directory for tests."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        old_cwd = os.getcwd()
-        os.chdir(temp_dir)
-        yield Path(temp_dir)
-        os.chdir(old_cwd)
-        # Close log file handlers BEFORE TemporaryDirectory.__exit__
-        # tries to delete the dir — Windows can't delete open files
-        _close_all_log_handlers()
+def temp_workspace(_ws_root):
+    """Create a temporary workspace directory for tests.
+
+    The directory is removed on teardown so tmpfs usage does not grow with
+    the number of tests run.
+    """
+    workspace = _ws_root / f"t{next(_ws_counter)}"
+    workspace.mkdir()
+    old_cwd = os.getcwd()
+    os.chdir(workspace)
+    yield workspace
+    os.chdir(old_cwd)
+    # Close log file handlers before removing the tree — Windows can't
+    # delete open files
+    _close_all_log_handlers()
+    shutil.rmtree(workspace, ignore_errors=True)
+
+
+@pytest.fixture
+def output_dir(temp_workspace):
+    """Create the ``output/`` directory inside ``temp_workspace``."""
+    output = temp_workspace / "output"
+    output.mkdir()
+    return output
+
+
+@pytest.fixture
+def make_config(temp_workspace):
+    """Factory building a ``TaskConfig`` for a step bound to ``temp_workspace``."""
+
+    def _make_config(step, context=None):
+        return TaskConfig(step, context if context is not None else {}, temp_workspace)
+
+    return _make_config
 
 
 @pytest.fixture
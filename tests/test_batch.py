@@ -279,6 +279,30 @@ def test_batch_context_variables(workspace, basic_context, sample_items):
         assert res["chunk_size"] == 2
 
 
+def test_batch_item_context_isolated(workspace, basic_context):
+    """Test that item contexts read the shared context without mutating it."""
+    step = {
+        "name": "test_batch_isolation",
+        "task": "batch",
+        "inputs": {
+            "items": [1, 2],
+            "task": {
+                "task": "python_code",
+                "inputs": {"code": """context['root_var'] = item
+result = (context['env']['test_env'], context['args']['test_arg'])"""},
+            },
+        },
+    }
+
+    config = TaskConfig(step, basic_context, workspace)
+    result = batch_task(config)
+
+    assert result["results"] == [("value2", "value1")] * 2
+    assert basic_context["root_var"] == "value4"
+    assert "item" not in basic_context["args"]
+    assert "batch" not in basic_context
+
+
 def test_batch_empty_items(workspace, basic_context):
     """Test batch processing with empty items list."""
     step = {
@@ -302,6 +326,29 @@ def test_batch_empty_items(workspace, basic_context):
     assert result["stats"]["success_rate"] == 100.0
 
 
+def test_batch_single_item_inline(workspace, basic_context):
+    """Test that a single-item batch runs on the calling thread."""
+    step = {
+        "name": "test_batch_single",
+        "task": "batch",
+        "inputs": {
+            "items": ["only"],
+            "task": {
+                "task": "python_code",
+                "inputs": {"code": """import threading
+result = threading.current_thread() is threading.main_thread()"""},
+            },
+        },
+    }
+
+    config = TaskConfig(step, basic_context, workspace)
+    result = batch_task(config)
+
+    assert result["processed"] == ["only"]
+    assert result["results"] == [True]
+    assert result["stats"]["success_rate"] == 100.0
+
+
 def test_parallel_execution_time(workspace, basic_context):
     """Test that parallel execution is faster than sequential."""
     step = {
@@ -164,6 +164,29 @@ def test_cli_run_with_custom_workspace(run_cli, sample_workflow_file, tmp_path):
     assert workspace_dir.exists()
 
 
+def test_cli_run_base_dir_defaults_to_workspace_parent(
+    run_cli, sample_workflow_file, tmp_path, monkeypatch
+):
+    """Test that --base-dir defaults to the parent of --workspace."""
+    monkeypatch.chdir(tmp_path)
+    workspace_dir = tmp_path / "runs_root" / "custom_workspace"
+
+    exit_code, out, err = run_cli(
+        [
+            "run",
+            str(sample_workflow_file),
+            "--workspace",
+            str(workspace_dir),
+            "name=Test",
+        ]
+    )
+    assert exit_code == 0, err
+    metadata = json.loads((workspace_dir / ".workflow_metadata.json").read_text())
+    assert metadata["base_dir"] == str(workspace_dir.parent.absolute())
+    # The implicit ./runs base directory is no longer created
+    assert not (tmp_path / "runs").exists()
+
+
 def test_cli_run_with_invalid_params(run_cli, sample_workflow_file, workspace_setup):
     """Test running workflow with invalid parameters."""
     exit_code, out, err = run_cli(
@@ -1,4 +1,5 @@
 import json
+import logging
 import os
 import tempfile
 from datetime import datetime
@@ -237,6 +238,44 @@ def test_custom_task_with_logging(temp_workspace):
     assert len(log_files) > 0
 
 
+def test_task_logger_follows_workspace(tmp_path):
+    """Test a task logger is reused per workspace and rebound on change."""
+    first_ws = tmp_path / "first"
+    second_ws = tmp_path / "second"
+
+    logger = get_task_logger(first_ws, "shared_name")
+    assert get_task_logger(first_ws, "shared_name").handlers == logger.handlers
+    logger.info("first run")
+
+    logger = get_task_logger(second_ws, "shared_name")
+    logger.info("second run")
+    for handler in logger.handlers:
+        handler.flush()
+
+    assert "first run" in (first_ws / "logs" / "shared_name.log").read_text()
+    second_log = (second_ws / "logs" / "shared_name.log").read_text()
+    assert "second run" in second_log
+    assert "first run" not in second_log
+
+
+def test_task_logging_skips_formatting_when_disabled(tmp_path):
+    """Test step/context/result are not formatted when the level filters them."""
+
+    class Unformattable:
+        def __repr__(self):
+            raise AssertionError("formatted while logging was disabled")
+
+    logger = get_task_logger(tmp_path, "quiet_task")
+    logger.setLevel(logging.WARNING)
+    try:
+        log_task_execution(
+            logger, {"name": "quiet_task"}, {"big": Unformattable()}, tmp_path
+        )
+        log_task_result(logger, Unformattable())
+    finally:
+        logger.setLevel(logging.DEBUG)
+
+
 def test_custom_task_registration():
     """Test custom task type registration."""
 
@@ -1,15 +1,23 @@
 import csv
+import errno
+import io
 import json
+import mmap
 import os
-import shutil
 from pathlib import Path
-from typing import Any, Dict, cast
 
 import pytest
 import yaml
 
+# Verify YAML through libyaml when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YDumper
+    from yaml import CSafeLoader as _YLoader
+except ImportError:  # pragma: no cover - depends on the PyYAML build
+    from yaml import SafeDumper as _YDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _YLoader  # type: ignore[assignment]
+
 from yaml_workflow.exceptions import TaskExecutionError, TemplateError
-from yaml_workflow.tasks import TaskConfig
 from yaml_workflow.tasks.file_tasks import (
     append_file_direct,
     append_file_task,
@@ -36,15 +44,62 @@ from yaml_workflow.tasks.file_tasks import (
 )
 
 
-@pytest.fixture
+def _mmap_eq(path, expected: bytes) -> bool:
+    """Compare ``path`` to ``expected`` through a read-only memory map.
+
+    Avoids copying (and decoding) large files into Python objects.
+    """
+    fd = os.open(str(path), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        if os.fstat(fd).st_size != len(expected):
+            return False
+        if not expected:
+            # mmap cannot map an empty file
+            return True
+        with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+            with memoryview(mm) as view:
+                return view == expected
+    finally:
+        os.close(fd)
+
+
+def _assert_bytes_eq(path, expected: bytes, large: bool = False):
+    """Assert ``path`` holds exactly ``expected``, using one open and one read.
+
+    Pass ``large=True`` for multi-megabyte content to compare via mmap.
+    """
+    if large:
+        assert _mmap_eq(path, expected), f"{path} does not match expected content"
+        return
+    fd = os.open(str(path), os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        # One extra byte catches files that are longer than expected
+        data = os.read(fd, len(expected) + 1)
+    finally:
+        os.close(fd)
+    assert data == expected
+
+
+def _assert_text_eq(path, expected: str, encoding: str = "utf-8", large: bool = False):
+    """Assert ``path`` holds exactly the encoded ``expected`` text."""
+    _assert_bytes_eq(path, expected.encode(encoding), large=large)
+
+
+_SAMPLE = {
+    "name": "Test User",
+    "age": 30,
+    "items": ["item1", "item2"],
+    "settings": {"theme": "dark", "notifications": True},
+}
+# Serialized once for the tests that seed input files
+_SAMPLE_JSON = json.dumps(_SAMPLE).encode()
+_SAMPLE_YAML = yaml.dump(_SAMPLE, Dumper=_YDumper).encode()
+
+
+@pytest.fixture(scope="session")
 def sample_data():
-    """Create sample data for file operations."""
-    return {
-        "name": "Test User",
-        "age": 30,
-        "items": ["item1", "item2"],
-        "settings": {"theme": "dark", "notifications": True},
-    }
+    """Sample data for file operations (shared; tests must not mutate it)."""
+    return _SAMPLE
 
 
 def test_write_text_file_direct(temp_workspace):
@@ -53,10 +108,29 @@ def test_write_text_file_direct(temp_workspace):
     content = "Hello, World!"
     result = write_file_direct(str(file_path), content, temp_workspace)
     assert result == str(file_path)
-    assert Path(file_path).read_text() == content
+    _assert_text_eq(file_path, content)
+
+
+def test_write_file_direct_bytes(temp_workspace):
+    """Test bytes content is written unchanged using direct function."""
+    file_path = temp_workspace / "raw.bin"
+    content = b"\x00\xffraw\r\n"
+    result = write_file_direct(str(file_path), content, temp_workspace)
+    assert result == str(file_path)
+    _assert_bytes_eq(file_path, content)
 
 
-def test_write_text_file_task(temp_workspace):
+def test_write_large_file(temp_workspace):
+    """Test writing multi-megabyte content using direct function."""
+    file_path = temp_workspace / "large.txt"
+    content = "0123456789abcdef\n" * (4 * 1024 * 1024 // 17)
+    result = write_file_direct(str(file_path), content, temp_workspace)
+    assert result == str(file_path)
+    _assert_text_eq(file_path, content, large=True)
+    assert not _mmap_eq(file_path, content[:-1].encode())
+
+
+def test_write_text_file_task(temp_workspace, make_config):
     """Test writing text file using task handler."""
     file_path = "output/test.txt"
     content = "Hello, World!"
@@ -68,13 +142,13 @@ def test_write_text_file_task(temp_workspace):
             "content": content,
         },
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     result = write_file_task(config)
     assert result is not None, "Task should return a result dictionary"
     expected_path = str(temp_workspace / file_path)
     assert result["path"] == expected_path
     assert result["content"] == content
-    assert Path(expected_path).read_text() == content
+    _assert_text_eq(expected_path, content)
 
 
 def test_read_text_file_direct(temp_workspace):
@@ -86,13 +160,36 @@ def test_read_text_file_direct(temp_workspace):
     assert result == content
 
 
-def test_read_text_file_task(temp_workspace):
+def test_read_large_file_direct(temp_workspace):
+    """Test reading a file above the mmap threshold using direct function."""
+    file_path = temp_workspace / "large.txt"
+    content = "héllo wörld\n" * 20000
+    file_path.write_bytes(content.encode("utf-8"))
+    assert read_file_direct(str(file_path), temp_workspace) == content
+
+    file_path.write_bytes(b"\xff" * 100000)
+    with pytest.raises(TaskExecutionError):
+        read_file_direct(str(file_path), temp_workspace)
+
+
+def test_read_large_file_direct_unmappable(temp_workspace, monkeypatch):
+    """Test reading a large file falls back to os.read when mmap fails."""
+
+    def _unmappable(*args, **kwargs):
+        raise OSError(errno.ENODEV, "No such device")
+
+    monkeypatch.setattr(mmap, "mmap", _unmappable)
+    file_path = temp_workspace / "large.txt"
+    content = "héllo wörld\n" * 20000
+    file_path.write_bytes(content.encode("utf-8"))
+    assert read_file_direct(str(file_path), temp_workspace) == content
+
+
+def test_read_text_file_task(output_dir, make_config):
     """Test reading text file using task handler."""
     file_path_relative = "test.txt"
     file_path_in_output = "output/test.txt"
     content = "Hello, World!"
-    output_dir = temp_workspace / "output"
-    output_dir.mkdir(exist_ok=True)
     full_path = output_dir / file_path_relative
     full_path.write_text(content)
     step = {
@@ -102,40 +199,42 @@ def test_read_text_file_task(temp_workspace):
             "file": file_path_in_output,
         },
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     result = read_file_task(config)
     assert result is not None, "Task should return a result dictionary"
     assert result["path"] == file_path_in_output
     assert result["content"] == content
 
 
-def test_write_json_file(tmp_path):
+def test_write_json_file(temp_workspace):
     """Test writing JSON file."""
     data = {"name": "Alice", "age": 25}
-    file_path = tmp_path / "data.json"
-    result = write_file_direct(str(file_path), json.dumps(data), tmp_path)
+    file_path = temp_workspace / "data.json"
+    result = write_file_direct(str(file_path), json.dumps(data), temp_workspace)
     assert result == str(file_path)
-    assert json.loads(Path(file_path).read_text()) == data
+    assert json.loads(Path(file_path).read_bytes()) == data
 
 
-def test_write_yaml_file(tmp_path):
+def test_write_yaml_file(temp_workspace):
     """Test writing YAML file."""
     data = {"name": "Bob", "age": 30}
-    file_path = tmp_path / "data.yaml"
-    result = write_file_direct(str(file_path), yaml.dump(data), tmp_path)
+    file_path = temp_workspace / "data.yaml"
+    result = write_file_direct(
+        str(file_path), yaml.dump(data, Dumper=_YDumper), temp_workspace
+    )
     assert result == str(file_path)
-    assert yaml.safe_load(Path(file_path).read_text()) == data
+    assert yaml.load(Path(file_path).read_bytes(), Loader=_YLoader) == data
 
 
-def test_append_text_file(tmp_path):
+def test_append_text_file(temp_workspace):
     """Test appending to text file."""
-    file_path = tmp_path / "test.txt"
+    file_path = temp_workspace / "test.txt"
     initial_content = "Hello"
     append_content = ", World!"
     Path(file_path).write_text(initial_content)
-    result = append_file_direct(str(file_path), append_content, tmp_path)
+    result = append_file_direct(str(file_path), append_content, temp_workspace)
     assert result == str(file_path)
-    assert Path(file_path).read_text() == initial_content + append_content
+    _assert_text_eq(file_path, initial_content + append_content)
 
 
 def test_copy_file_direct(temp_workspace):
@@ -146,18 +245,67 @@ def test_copy_file_direct(temp_workspace):
     source_path.write_text(content)
     result = copy_file_direct(str(source_path), str(dest_path), temp_workspace)
     assert result == str(dest_path)
-    assert Path(dest_path).read_text() == content
+    _assert_text_eq(dest_path, content)
+
+
+def test_copy_file_direct_fallback(temp_workspace, monkeypatch):
+    """Test copying falls back to a buffered copy when copy_file_range fails."""
+
+    def _unsupported(*args):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(os, "copy_file_range", _unsupported, raising=False)
+    source_path = temp_workspace / "source.bin"
+    content = bytes(range(256)) * 4096
+    source_path.write_bytes(content)
+    dest_path = temp_workspace / "dest.bin"
+    copy_file_direct(str(source_path), str(dest_path), temp_workspace)
+    _assert_bytes_eq(dest_path, content)
 
 
-def test_copy_file_task(temp_workspace):
+def test_copy_file_direct_zero_length_copy_range(temp_workspace, monkeypatch):
+    """Test copying falls back when copy_file_range reports 0 bytes up front."""
+    monkeypatch.setattr(os, "copy_file_range", lambda *args: 0, raising=False)
+    source_path = temp_workspace / "source.bin"
+    content = bytes(range(256)) * 16
+    source_path.write_bytes(content)
+    dest_path = temp_workspace / "dest.bin"
+    copy_file_direct(str(source_path), str(dest_path), temp_workspace)
+    _assert_bytes_eq(dest_path, content)
+
+
+def test_move_file_direct_cross_device(temp_workspace, monkeypatch):
+    """Test moving falls back to shutil.move across filesystems."""
+
+    def _cross_device(src, dst):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(os, "replace", _cross_device)
+    source_path = temp_workspace / "source.txt"
+    source_path.write_text("moved")
+    dest_path = temp_workspace / "sub" / "dest.txt"
+    result = move_file_direct(str(source_path), str(dest_path), temp_workspace)
+    assert result == str(dest_path)
+    assert not source_path.exists()
+    _assert_text_eq(dest_path, "moved")
+
+
+def test_copy_file_direct_same_file(temp_workspace):
+    """Test copying a file onto itself fails without truncating it."""
+    source_path = temp_workspace / "same.txt"
+    source_path.write_text("keep me")
+    with pytest.raises(TaskExecutionError):
+        copy_file_direct(str(source_path), str(source_path), temp_workspace)
+    _assert_text_eq(source_path, "keep me")
+
+
+def test_copy_file_task(temp_workspace, output_dir, make_config):
     """Test copying file using task handler."""
     source_relative = "source.txt"
     dest_relative = "dest.txt"
     source_in_output = "output/source.txt"
     dest_in_output = "output/dest.txt"
     content = "Test content"
-    output_dir = temp_workspace / "output"
-    output_dir.mkdir(exist_ok=True)
     (output_dir / source_relative).write_text(content)
     step = {
         "name": "copy_test",
@@ -167,14 +315,14 @@ def test_copy_file_task(temp_workspace):
             "destination": dest_in_output,
         },
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     result = copy_file_task(config)
     assert result is not None
     expected_src_path = str(temp_workspace / source_in_output)
     expected_dest_path = str(temp_workspace / dest_in_output)
     assert result["source"] == source_in_output
     assert result["destination"] == expected_dest_path
-    assert Path(expected_dest_path).read_text() == content
+    _assert_text_eq(expected_dest_path, content)
 
 
 def test_move_file_direct(temp_workspace):
@@ -185,19 +333,30 @@ def test_move_file_direct(temp_workspace):
     source_path.write_text(content)
     result = move_file_direct(str(source_path), str(dest_path), temp_workspace)
     assert result == str(dest_path)
-    assert Path(dest_path).read_text() == content
+    _assert_text_eq(dest_path, content)
     assert not source_path.exists()
 
 
-def test_move_file_task(temp_workspace):
+def test_move_file_direct_into_dir_existing(temp_workspace):
+    """Test moving into a directory refuses to overwrite a same-named file."""
+    source_path = temp_workspace / "source.txt"
+    source_path.write_text("new")
+    dest_dir = temp_workspace / "dest"
+    dest_dir.mkdir()
+    (dest_dir / "source.txt").write_text("old")
+    with pytest.raises(TaskExecutionError):
+        move_file_direct(str(source_path), str(dest_dir), temp_workspace)
+    _assert_text_eq(dest_dir / "source.txt", "old")
+    assert source_path.exists()
+
+
+def test_move_file_task(temp_workspace, output_dir, make_config):
     """Test moving file using task handler."""
     source_relative = "source.txt"
     dest_relative = "dest.txt"
     source_in_output = "output/source.txt"
     dest_in_output = "output/dest.txt"
     content = "Test content"
-    output_dir = temp_workspace / "output"
-    output_dir.mkdir(exist_ok=True)
     source_path_abs = output_dir / source_relative
     source_path_abs.write_text(content)
     step = {
@@ -208,14 +367,14 @@ def test_move_file_task(temp_workspace):
             "destination": dest_in_output,
         },
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     result = move_file_task(config)
     assert result is not None
     expected_src_path = str(temp_workspace / source_in_output)
     expected_dest_path = str(temp_workspace / dest_in_output)
     assert result["source"] == source_in_output
     assert result["destination"] == expected_dest_path
-    assert Path(expected_dest_path).read_text() == content
+    _assert_text_eq(expected_dest_path, content)
     assert not source_path_abs.exists()
 
 
@@ -229,12 +388,10 @@ def test_delete_file_direct(temp_workspace):
     assert not file_path.exists()
 
 
-def test_delete_file_task(temp_workspace):
+def test_delete_file_task(output_dir, make_config):
     """Test deleting file using task handler."""
     file_path_relative = "test_to_delete.txt"
     file_path_in_output = "output/test_to_delete.txt"
-    output_dir = temp_workspace / "output"
-    output_dir.mkdir(exist_ok=True)
     full_path = output_dir / file_path_relative
     full_path.write_text("delete me")
     assert full_path.exists()
@@ -246,7 +403,7 @@ def test_delete_file_task(temp_workspace):
             "file": file_path_in_output,
         },
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     result = delete_file_task(config)
     assert result is not None, "Task should return a result dictionary"
     expected_path = str(full_path)
@@ -254,167 +411,138 @@ def test_delete_file_task(temp_workspace):
     assert not full_path.exists()
 
 
-def test_write_csv_file(tmp_path):
+def test_write_csv_file(temp_workspace):
     """Test writing CSV file."""
     data = [
         ["Name", "Age", "City"],
         ["Alice", "25", "New York"],
         ["Bob", "30", "London"],
     ]
-    file_path = os.path.join(tmp_path, "data.csv")
-    csv_content = "\n".join([",".join(row) for row in data])
-    result = write_file_direct(file_path, csv_content, tmp_path)
+    file_path = os.path.join(temp_workspace, "data.csv")
+    buf = io.StringIO()
+    csv.writer(buf, lineterminator="\n").writerows(data)
+    csv_content = buf.getvalue().rstrip("\n")
+    result = write_file_direct(file_path, csv_content, temp_workspace)
     assert result == file_path
-    assert Path(file_path).read_text() == csv_content
-
-
-def test_file_tasks_missing_inputs(temp_workspace):
+    _assert_text_eq(file_path, csv_content)
+
+
+@pytest.mark.parametrize(
+    "task_fn, step, msg",
+    [
+        (
+            write_file_task,
+            {"name": "w1", "task": "write_file", "inputs": {"content": "c"}},
+            "No file path provided",
+        ),
+        (
+            write_file_task,
+            {"name": "w2", "task": "write_file", "inputs": {"file": "f.txt"}},
+            "No content provided",
+        ),
+        (
+            read_file_task,
+            {"name": "r1", "task": "read_file", "inputs": {}},
+            "No file path provided",
+        ),
+        (
+            copy_file_task,
+            {"name": "c1", "task": "copy_file", "inputs": {"destination": "d"}},
+            "No source file provided",
+        ),
+        (
+            copy_file_task,
+            {"name": "c2", "task": "copy_file", "inputs": {"source": "s"}},
+            "No destination file provided",
+        ),
+        (
+            move_file_task,
+            {"name": "m1", "task": "move_file", "inputs": {"destination": "d"}},
+            "No source file provided",
+        ),
+        (
+            move_file_task,
+            {"name": "m2", "task": "move_file", "inputs": {"source": "s"}},
+            "No destination file provided",
+        ),
+        (
+            append_file_task,
+            {"name": "a1", "task": "append_file", "inputs": {"content": "c"}},
+            "No file path provided",
+        ),
+        (
+            append_file_task,
+            {"name": "a2", "task": "append_file", "inputs": {"file": "f.txt"}},
+            "No content provided",
+        ),
+        (
+            delete_file_task,
+            {"name": "d1", "task": "delete_file", "inputs": {}},
+            "No file path provided",
+        ),
+    ],
+    ids=lambda v: v["name"] if isinstance(v, dict) else None,
+)
+def test_file_tasks_missing_inputs(make_config, task_fn, step, msg):
     """Test file tasks fail when required inputs are missing."""
-    # Test write_file_task missing 'file'
-    step_write_no_file = {
-        "name": "w1",
-        "task": "write_file",
-        "inputs": {"content": "c"},
-    }
-    config_w1 = TaskConfig(step_write_no_file, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_w1:
-        write_file_task(config_w1)
-    assert "No file path provided" in str(excinfo_w1.value.original_error)
-
-    # Test write_file_task missing 'content'
-    step_write_no_content = {
-        "name": "w2",
-        "task": "write_file",
-        "inputs": {"file": "f.txt"},
-    }
-    config_w2 = TaskConfig(step_write_no_content, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_w2:
-        write_file_task(config_w2)
-    assert "No content provided" in str(excinfo_w2.value.original_error)
-
-    # Test read_file_task missing 'file'
-    step_read_no_file = {"name": "r1", "task": "read_file", "inputs": {}}
-    config_r1 = TaskConfig(step_read_no_file, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_r1:
-        read_file_task(config_r1)
-    assert "No file path provided" in str(excinfo_r1.value.original_error)
-
-    # Test copy_file_task missing 'source'
-    step_copy_no_source = {
-        "name": "c1",
-        "task": "copy_file",
-        "inputs": {"destination": "d"},
-    }
-    config_c1 = TaskConfig(step_copy_no_source, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_c1:
-        copy_file_task(config_c1)
-    assert "No source file provided" in str(excinfo_c1.value.original_error)
-
-    # Test copy_file_task missing 'destination'
-    step_copy_no_dest = {"name": "c2", "task": "copy_file", "inputs": {"source": "s"}}
-    config_c2 = TaskConfig(step_copy_no_dest, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_c2:
-        copy_file_task(config_c2)
-    assert "No destination file provided" in str(excinfo_c2.value.original_error)
-
-    # Test move_file_task missing 'source'
-    step_move_no_source = {
-        "name": "m1",
-        "task": "move_file",
-        "inputs": {"destination": "d"},
-    }
-    config_m1 = TaskConfig(step_move_no_source, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_m1:
-        move_file_task(config_m1)
-    assert "No source file provided" in str(excinfo_m1.value.original_error)
-
-    # Test move_file_task missing 'destination'
-    step_move_no_dest = {"name": "m2", "task": "move_file", "inputs": {"source": "s"}}
-    config_m2 = TaskConfig(step_move_no_dest, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_m2:
-        move_file_task(config_m2)
-    assert "No destination file provided" in str(excinfo_m2.value.original_error)
-
-    # Test append_file_task missing 'file'
-    step_append_no_file = {
-        "name": "a1",
-        "task": "append_file",
-        "inputs": {"content": "c"},
-    }
-    config_a1 = TaskConfig(step_append_no_file, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_a1:
-        append_file_task(config_a1)
-    assert "No file path provided" in str(excinfo_a1.value.original_error)
-
-    # Test append_file_task missing 'content'
-    step_append_no_content = {
-        "name": "a2",
-        "task": "append_file",
-        "inputs": {"file": "f.txt"},
-    }
-    config_a2 = TaskConfig(step_append_no_content, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_a2:
-        append_file_task(config_a2)
-    assert "No content provided" in str(excinfo_a2.value.original_error)
-
-    # Test delete_file_task missing 'file'
-    step_delete_no_file = {"name": "d1", "task": "delete_file", "inputs": {}}
-    config_d1 = TaskConfig(step_delete_no_file, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_d1:
-        delete_file_task(config_d1)
-    assert "No file path provided" in str(excinfo_d1.value.original_error)
-
-
-def test_file_tasks_file_not_found(temp_workspace):
+    config = make_config(step)
+    with pytest.raises(TaskExecutionError) as excinfo:
+        task_fn(config)
+    assert msg in str(excinfo.value.original_error)
+
+
+@pytest.mark.parametrize(
+    "task_fn, step",
+    [
+        (
+            read_file_task,
+            {
+                "name": "r_nf",
+                "task": "read_file",
+                "inputs": {"file": "non_existent_file.txt"},
+            },
+        ),
+        (
+            copy_file_task,
+            {
+                "name": "c_nf",
+                "task": "copy_file",
+                "inputs": {"source": "non_existent_file.txt", "destination": "d.txt"},
+            },
+        ),
+        (
+            move_file_task,
+            {
+                "name": "m_nf",
+                "task": "move_file",
+                "inputs": {"source": "non_existent_file.txt", "destination": "d.txt"},
+            },
+        ),
+    ],
+    ids=lambda v: v["name"] if isinstance(v, dict) else None,
+)
+def test_file_tasks_file_not_found(temp_workspace, make_config, task_fn, step):
     """Test file tasks handle file not found errors."""
-    non_existent_file = "non_existent_file.txt"
-    existing_file = "existing.txt"
-    (temp_workspace / existing_file).write_text("exists")
+    (temp_workspace / "existing.txt").write_text("exists")
+    config = make_config(step)
+    with pytest.raises(TaskExecutionError) as excinfo:
+        task_fn(config)
+    assert isinstance(excinfo.value.original_error, FileNotFoundError)
 
-    # Test read_file_task
-    step_read = {
-        "name": "r_nf",
-        "task": "read_file",
-        "inputs": {"file": non_existent_file},
-    }
-    config_read = TaskConfig(step_read, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_read:
-        read_file_task(config_read)
-    assert isinstance(excinfo_read.value.original_error, FileNotFoundError)
 
-    # Test copy_file_task (source not found)
-    step_copy = {
-        "name": "c_nf",
-        "task": "copy_file",
-        "inputs": {"source": non_existent_file, "destination": "d.txt"},
-    }
-    config_copy = TaskConfig(step_copy, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_copy:
-        copy_file_task(config_copy)
-    assert isinstance(excinfo_copy.value.original_error, FileNotFoundError)
-
-    # Test move_file_task (source not found)
-    step_move = {
-        "name": "m_nf",
-        "task": "move_file",
-        "inputs": {"source": non_existent_file, "destination": "d.txt"},
-    }
-    config_move = TaskConfig(step_move, {}, temp_workspace)
-    with pytest.raises(TaskExecutionError) as excinfo_move:
-        move_file_task(config_move)
-    assert isinstance(excinfo_move.value.original_error, FileNotFoundError)
-
-    # Test delete_file_task (file not found is okay, should not raise error)
+def test_delete_file_task_file_not_found(output_dir, make_config):
+    """Test delete_file_task treats a missing file as already deleted."""
+    non_existent_file = "non_existent_file.txt"
     step_del = {
         "name": "d_nf",
         "task": "delete_file",
         "inputs": {"file": f"output/{non_existent_file}"},
     }
-    config_del = TaskConfig(step_del, {}, temp_workspace)
+    config_del = make_config(step_del)
     try:
         result_del = delete_file_task(config_del)
         assert result_del is not None
-        expected_del_path = str(temp_workspace / "output" / non_existent_file)
+        expected_del_path = str(output_dir / non_existent_file)
         assert result_del["path"] == expected_del_path
     except TaskExecutionError as e:
         pytest.fail(f"delete_file_task raised an unexpected error: {e}")
@@ -425,15 +553,13 @@ def test_file_error_handling(temp_workspace):
     pass  # Keep existing structure, add more specific tests later if needed
 
 
-def test_append_file_task(temp_workspace):
+def test_append_file_task(output_dir, make_config):
     """Test appending to a file using task handler."""
     file_path_relative = "test.txt"
     file_path_in_output = "output/test.txt"
     initial_content = "Hello"
     append_content = ", World!"
 
-    output_dir = temp_workspace / "output"
-    output_dir.mkdir(exist_ok=True)
     full_path = output_dir / file_path_relative
     full_path.write_text(initial_content)
 
@@ -445,47 +571,51 @@ def test_append_file_task(temp_workspace):
             "content": append_content,
         },
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     result = append_file_task(config)
     assert result is not None
     expected_path = str(full_path)
     assert result["path"] == expected_path
     assert result["content"] == append_content
-    assert full_path.read_text() == initial_content + append_content
+    _assert_text_eq(full_path, initial_content + append_content)
 
 
-def test_json_tasks(temp_workspace, sample_data):
-    """Test read_json_task and write_json_task."""
-    file_path_relative = "data.json"
+def test_json_tasks_write(temp_workspace, make_config, sample_data):
+    """Test write_json_task."""
     file_path_in_output = "output/data.json"
     full_path = temp_workspace / file_path_in_output
 
-    # Test write_json_task
     step_write = {
         "name": "write_json_test",
         "task": "write_json",
         "inputs": {"file": file_path_in_output, "data": sample_data},
     }
-    config_w = TaskConfig(step_write, {}, temp_workspace)
+    config_w = make_config(step_write)
     result_w = write_json_task(config_w)
     assert result_w is not None
     assert result_w["path"] == str(full_path)
     assert full_path.exists()
-    with open(full_path, "r") as f:
-        assert json.load(f) == sample_data
+    assert json.loads(full_path.read_bytes()) == sample_data
+
+
+def test_json_tasks_read(output_dir, make_config, sample_data):
+    """Test read_json_task."""
+    file_path_in_output = "output/data.json"
+    (output_dir / "data.json").write_bytes(_SAMPLE_JSON)
 
-    # Test read_json_task
     step_read = {
         "name": "read_json_test",
         "task": "read_json",
         "inputs": {"file": file_path_in_output},
     }
-    config_r = TaskConfig(step_read, {}, temp_workspace)
+    config_r = make_config(step_read)
     result_r = read_json_task(config_r)
     assert result_r is not None
     assert result_r["data"] == sample_data
 
-    # Test direct function calls
+
+def test_json_tasks_direct(temp_workspace, sample_data):
+    """Test write_json_direct and read_json round trip."""
     direct_file_path = temp_workspace / "direct.json"
     write_json_direct(str(direct_file_path), sample_data, workspace=temp_workspace)
     assert direct_file_path.exists()
@@ -493,38 +623,42 @@ def test_json_tasks(temp_workspace, sample_data):
     assert read_data == sample_data
 
 
-def test_yaml_tasks(temp_workspace, sample_data):
-    """Test read_yaml_task and write_yaml_task."""
-    file_path_relative = "data.yaml"
+def test_yaml_tasks_write(temp_workspace, make_config, sample_data):
+    """Test write_yaml_task."""
     file_path_in_output = "output/data.yaml"
     full_path = temp_workspace / file_path_in_output
 
-    # Test write_yaml_task
     step_write = {
         "name": "write_yaml_test",
         "task": "write_yaml",
         "inputs": {"file": file_path_in_output, "data": sample_data},
     }
-    config_w = TaskConfig(step_write, {}, temp_workspace)
+    config_w = make_config(step_write)
     result_w = write_yaml_task(config_w)
     assert result_w is not None
     assert result_w["path"] == str(full_path)
     assert full_path.exists()
-    with open(full_path, "r") as f:
-        assert yaml.safe_load(f) == sample_data
+    assert yaml.load(full_path.read_bytes(), Loader=_YLoader) == sample_data
+
+
+def test_yaml_tasks_read(output_dir, make_config, sample_data):
+    """Test read_yaml_task."""
+    file_path_in_output = "output/data.yaml"
+    (output_dir / "data.yaml").write_bytes(_SAMPLE_YAML)
 
-    # Test read_yaml_task
     step_read = {
         "name": "read_yaml_test",
         "task": "read_yaml",
         "inputs": {"file": file_path_in_output},
     }
-    config_r = TaskConfig(step_read, {}, temp_workspace)
+    config_r = make_config(step_read)
     result_r = read_yaml_task(config_r)
     assert result_r is not None
     assert result_r["data"] == sample_data
 
-    # Test direct function calls
+
+def test_yaml_tasks_direct(temp_workspace, sample_data):
+    """Test write_yaml_direct and read_yaml round trip."""
     direct_file_path = temp_workspace / "direct.yaml"
     write_yaml_direct(str(direct_file_path), sample_data, temp_workspace)
     assert direct_file_path.exists()
@@ -532,7 +666,45 @@ def test_yaml_tasks(temp_workspace, sample_data):
     assert read_data == sample_data
 
 
-def test_file_tasks_with_templating(temp_workspace):
+class _Point:
+    """Plain object the safe YAML dumper cannot represent."""
+
+    def __init__(self, x):
+        self.x = x
+
+
+def test_write_yaml_direct_non_safe_types(temp_workspace):
+    """Test write_yaml_direct still writes types the safe dumper rejects."""
+    file_path = temp_workspace / "tagged.yaml"
+    data = {"point": _Point(1), "tags": {"a"}, "pair": (1, 2)}
+    write_yaml_direct(str(file_path), data, temp_workspace)
+    loaded = yaml.unsafe_load(file_path.read_text())
+    assert isinstance(loaded["point"], _Point) and loaded["point"].x == 1
+    assert loaded["tags"] == {"a"}
+    assert loaded["pair"] == (1, 2)
+
+
+@pytest.mark.parametrize(
+    "write_fn, read_fn, name",
+    [
+        (write_json_direct, read_json, "cached.json"),
+        (write_yaml_direct, read_yaml, "cached.yaml"),
+    ],
+    ids=["json", "yaml"],
+)
+def test_structured_read_cache(temp_workspace, write_fn, read_fn, name):
+    """Repeated reads return independent copies and see rewrites."""
+    write_fn(name, {"items": [1, 2]}, workspace=temp_workspace)
+    first = read_fn(name, temp_workspace)
+    first["items"].append(3)
+    assert read_fn(name, temp_workspace) == {"items": [1, 2]}
+
+    # Same size, so only the invalidation on write makes this visible
+    write_fn(name, {"items": [4, 5]}, workspace=temp_workspace)
+    assert read_fn(name, temp_workspace) == {"items": [4, 5]}
+
+
+def test_file_tasks_with_templating(temp_workspace, output_dir, make_config):
     """Test file tasks with templated inputs."""
     context = {
         "args": {
@@ -545,9 +717,7 @@ def test_file_tasks_with_templating(temp_workspace):
     }
     # Setup source file inside output/
     source_content = "This is the source file content."
-    output_dir_tmpl = temp_workspace / "output"
-    output_dir_tmpl.mkdir(parents=True, exist_ok=True)
-    (output_dir_tmpl / context["args"]["source_file"]).write_text(source_content)
+    (output_dir / context["args"]["source_file"]).write_text(source_content)
 
     # Test write_file_task with templated path and content
     step_write = {
@@ -558,7 +728,7 @@ def test_file_tasks_with_templating(temp_workspace):
             "content": "{{ args.message }}",
         },
     }
-    config_w = TaskConfig(step_write, context, temp_workspace)
+    config_w = make_config(step_write, context)
     result_w = write_file_task(config_w)
     expected_path = (
         temp_workspace / context["args"]["output_dir"] / context["args"]["filename"]
@@ -566,7 +736,7 @@ def test_file_tasks_with_templating(temp_workspace):
     assert result_w["path"] == str(expected_path)
     assert result_w["content"] == context["args"]["message"]
     assert expected_path.exists()
-    assert expected_path.read_text() == context["args"]["message"]
+    _assert_text_eq(expected_path, context["args"]["message"])
 
     # Test read_file_task with templated path
     step_read = {
@@ -574,7 +744,7 @@ def test_file_tasks_with_templating(temp_workspace):
         "task": "read_file",
         "inputs": {"file": "{{ args.output_dir }}/{{ args.filename }}"},
     }
-    config_r = TaskConfig(step_read, context, temp_workspace)
+    config_r = make_config(step_read, context)
     result_r = read_file_task(config_r)
     expected_read_input_path = (
         f"{context['args']['output_dir']}/{context['args']['filename']}"
@@ -591,7 +761,7 @@ def test_file_tasks_with_templating(temp_workspace):
             "destination": "{{ args.dest_dir }}/copied_{{ args.filename }}",
         },
     }
-    config_c = TaskConfig(step_copy, context, temp_workspace)
+    config_c = make_config(step_copy, context)
     result_c = copy_file_task(config_c)
     expected_copy_input_source = f"output/{context['args']['source_file']}"
     expected_dest_path = (
@@ -602,10 +772,10 @@ def test_file_tasks_with_templating(temp_workspace):
     assert result_c["source"] == expected_copy_input_source
     assert result_c["destination"] == str(expected_dest_path)
     assert expected_dest_path.exists()
-    assert expected_dest_path.read_text() == source_content
+    _assert_text_eq(expected_dest_path, source_content)
 
 
-def test_file_tasks_with_absolute_paths(temp_workspace):
+def test_file_tasks_with_absolute_paths(temp_workspace, make_config):
     """Test file tasks when absolute paths are provided in inputs."""
     absolute_dir = temp_workspace / "absolute_test_dir"
     absolute_dir.mkdir()
@@ -619,10 +789,10 @@ def test_file_tasks_with_absolute_paths(temp_workspace):
         "task": "write_file",
         "inputs": {"file": str(absolute_file), "content": content},
     }
-    config = TaskConfig(step_write, {}, temp_workspace)
+    config = make_config(step_write)
     result = write_file_task(config)
     assert result["path"] == str(absolute_file)
-    assert absolute_file.read_text() == content
+    _assert_text_eq(absolute_file, content)
 
     # Read File Task
     step_read = {
@@ -630,7 +800,7 @@ def test_file_tasks_with_absolute_paths(temp_workspace):
         "task": "read_file",
         "inputs": {"file": str(absolute_file)},
     }
-    config = TaskConfig(step_read, {}, temp_workspace)
+    config = make_config(step_read)
     result = read_file_task(config)
     assert result["path"] == str(absolute_file)
     assert result["content"] == content
@@ -641,11 +811,11 @@ def test_file_tasks_with_absolute_paths(temp_workspace):
         "task": "copy_file",
         "inputs": {"source": str(absolute_file), "destination": str(absolute_dest)},
     }
-    config = TaskConfig(copy_step, {}, temp_workspace)
+    config = make_config(copy_step)
     result = copy_file_task(config)
     assert result["source"] == str(absolute_file)
     assert result["destination"] == str(absolute_dest)
-    assert absolute_dest.read_text() == content
+    _assert_text_eq(absolute_dest, content)
 
     # Delete File Task (deleting the copy)
     delete_step = {
@@ -653,7 +823,7 @@ def test_file_tasks_with_absolute_paths(temp_workspace):
         "task": "delete_file",
         "inputs": {"file": str(absolute_dest)},
     }
-    config = TaskConfig(delete_step, {}, temp_workspace)
+    config = make_config(delete_step)
     result = delete_file_task(config)
     assert result["path"] == str(absolute_dest)
     assert not absolute_dest.exists()
@@ -668,13 +838,13 @@ def test_file_tasks_with_absolute_paths(temp_workspace):
         "task": "move_file",
         "inputs": {"source": str(absolute_file), "destination": str(move_dest)},
     }
-    config = TaskConfig(move_step, {}, temp_workspace)
+    config = make_config(move_step)
     result = move_file_task(config)
     assert result["source"] == str(absolute_file)
     assert result["destination"] == str(move_dest)
     assert not absolute_file.exists()  # Original should be gone
     assert move_dest.exists()
-    assert move_dest.read_text() == content
+    _assert_text_eq(move_dest, content)
 
 
 # ─── ensure_directory error path (lines 34-35) ───
@@ -784,33 +954,33 @@ def test_delete_file_direct_io_error(tmp_path):
 # ─── read_json_task missing inputs and error paths (lines 498, 504-519) ───
 
 
-def test_read_json_task_missing_file(temp_workspace):
+def test_read_json_task_missing_file(make_config):
     """Test read_json_task raises error when file param is missing."""
     step = {"name": "rj1", "task": "read_json", "inputs": {}}
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError) as exc:
         read_json_task(config)
     assert "No file path provided" in str(exc.value.original_error)
 
 
-def test_read_json_task_invalid_json(temp_workspace):
+def test_read_json_task_invalid_json(temp_workspace, make_config):
     """Test read_json_task raises error when file contains invalid JSON."""
     bad_json = temp_workspace / "bad.json"
     bad_json.write_text("not valid json {{{")
     step = {"name": "rj2", "task": "read_json", "inputs": {"file": "bad.json"}}
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError):
         read_json_task(config)
 
 
-def test_read_json_task_file_not_found(temp_workspace):
+def test_read_json_task_file_not_found(make_config):
     """Test read_json_task raises error when file does not exist."""
     step = {
         "name": "rj3",
         "task": "read_json",
         "inputs": {"file": "nonexistent.json"},
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError):
         read_json_task(config)
 
@@ -818,79 +988,78 @@ def test_read_json_task_file_not_found(temp_workspace):
 # ─── write_json_task missing inputs and error paths (lines 545-551, 554-562, 582-597) ───
 
 
-def test_write_json_task_missing_file(temp_workspace):
+def test_write_json_task_missing_file(make_config):
     """Test write_json_task raises error when file param is missing."""
     step = {
         "name": "wj1",
         "task": "write_json",
         "inputs": {"data": {"key": "val"}},
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError) as exc:
         write_json_task(config)
     assert "No file path provided" in str(exc.value.original_error)
 
 
-def test_write_json_task_missing_data(temp_workspace):
+def test_write_json_task_missing_data(make_config):
     """Test write_json_task raises error when data param is missing."""
     step = {
         "name": "wj2",
         "task": "write_json",
         "inputs": {"file": "output/out.json"},
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError) as exc:
         write_json_task(config)
     assert "No data provided" in str(exc.value.original_error)
 
 
-def test_write_json_task_output_dir_creation(temp_workspace):
+def test_write_json_task_output_dir_creation(temp_workspace, make_config):
     """Test write_json_task creates output/ directory when file path contains it."""
     step = {
         "name": "wj3",
         "task": "write_json",
         "inputs": {"file": "output/test.json", "data": {"hello": "world"}},
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     result = write_json_task(config)
     assert result is not None
     assert (temp_workspace / "output").is_dir()
     output_file = Path(result["path"])
     assert output_file.exists()
-    with open(output_file) as f:
-        assert json.load(f) == {"hello": "world"}
+    assert json.loads(output_file.read_bytes()) == {"hello": "world"}
 
 
 # ─── read_yaml_task missing inputs and error paths (lines 614, 620-635) ───
 
 
-def test_read_yaml_task_missing_file(temp_workspace):
+def test_read_yaml_task_missing_file(make_config):
     """Test read_yaml_task raises error when file param is missing."""
     step = {"name": "ry1", "task": "read_yaml", "inputs": {}}
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError) as exc:
         read_yaml_task(config)
     assert "No file path provided" in str(exc.value.original_error)
 
 
-def test_read_yaml_task_file_not_found(temp_workspace):
+def test_read_yaml_task_file_not_found(make_config):
     """Test read_yaml_task raises error when file does not exist."""
     step = {
         "name": "ry2",
         "task": "read_yaml",
         "inputs": {"file": "nonexistent.yaml"},
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError):
         read_yaml_task(config)
 
 
-def test_read_yaml_task_invalid_yaml(temp_workspace):
+def test_read_yaml_task_invalid_yaml(temp_workspace, make_config):
     """Test read_yaml_task raises error when file contains invalid YAML."""
     bad_yaml = temp_workspace / "bad.yaml"
     bad_yaml.write_text(":\n  :\n  - :\n    invalid: [")
     step = {"name": "ry3", "task": "read_yaml", "inputs": {"file": "bad.yaml"}}
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError):
         read_yaml_task(config)
 
@@ -898,27 +1067,27 @@ def test_read_yaml_task_invalid_yaml(temp_workspace):
 # ─── write_yaml_task missing inputs and error paths (lines 652, 654, 666-681) ───
 
 
-def test_write_yaml_task_missing_file(temp_workspace):
+def test_write_yaml_task_missing_file(make_config):
     """Test write_yaml_task raises error when file param is missing."""
     step = {
         "name": "wy1",
         "task": "write_yaml",
         "inputs": {"data": {"key": "val"}},
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError) as exc:
         write_yaml_task(config)
     assert "No file path provided" in str(exc.value.original_error)
 
 
-def test_write_yaml_task_missing_data(temp_workspace):
+def test_write_yaml_task_missing_data(make_config):
     """Test write_yaml_task raises error when data param is missing."""
     step = {
         "name": "wy2",
         "task": "write_yaml",
         "inputs": {"file": "out.yaml"},
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError) as exc:
         write_yaml_task(config)
     assert "No data provided" in str(exc.value.original_error)
@@ -993,6 +1162,7 @@ def test_write_json_direct_type_error(tmp_path):
     file_path = tmp_path / "bad.json"
     with pytest.raises(TemplateError, match="Failed to write JSON"):
         write_json_direct(str(file_path), {1, 2, 3}, workspace=tmp_path)
+    assert not file_path.exists()
 
 
 def test_write_json_direct_io_error(tmp_path):
@@ -1014,8 +1184,7 @@ def test_write_json_direct_with_logger(tmp_path):
         str(file_path), {"key": "value"}, workspace=tmp_path, logger=logger
     )
     assert Path(result).exists()
-    with open(result) as f:
-        assert json.load(f) == {"key": "value"}
+    assert json.loads(Path(result).read_bytes()) == {"key": "value"}
 
 
 def test_write_json_direct_error_with_logger(tmp_path):
@@ -1076,10 +1245,10 @@ def test_move_file_direct_missing_source(tmp_path):
 # ─── delete_file_task missing file param (line 481) ───
 
 
-def test_delete_file_task_missing_file_param(temp_workspace):
+def test_delete_file_task_missing_file_param(make_config):
     """Test delete_file_task raises error when file param is missing."""
     step = {"name": "df1", "task": "delete_file", "inputs": {}}
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError) as exc:
         delete_file_task(config)
     assert "No file path provided" in str(exc.value.original_error)
@@ -1088,27 +1257,27 @@ def test_delete_file_task_missing_file_param(temp_workspace):
 # ─── append_file_task error paths (line 385) ───
 
 
-def test_append_file_task_missing_file(temp_workspace):
+def test_append_file_task_missing_file(make_config):
     """Test append_file_task raises error when file param is missing."""
     step = {
         "name": "af1",
         "task": "append_file",
         "inputs": {"content": "c"},
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError) as exc:
         append_file_task(config)
     assert "No file path provided" in str(exc.value.original_error)
 
 
-def test_append_file_task_missing_content(temp_workspace):
+def test_append_file_task_missing_content(make_config):
     """Test append_file_task raises error when content param is missing."""
     step = {
         "name": "af2",
         "task": "append_file",
         "inputs": {"file": "f.txt"},
     }
-    config = TaskConfig(step, {}, temp_workspace)
+    config = make_config(step)
     with pytest.raises(TaskExecutionError) as exc:
         append_file_task(config)
     assert "No content provided" in str(exc.value.original_error)
@@ -1122,8 +1291,7 @@ def test_write_json_direct_no_workspace(tmp_path):
     file_path = str(tmp_path / "no_ws.json")
     result = write_json_direct(file_path, {"test": True}, workspace=None)
     assert result == file_path
-    with open(file_path) as f:
-        assert json.load(f) == {"test": True}
+    assert json.loads(Path(file_path).read_bytes()) == {"test": True}
 
 
 def test_write_yaml_direct_no_workspace(tmp_path):
@@ -1131,8 +1299,7 @@ def test_write_yaml_direct_no_workspace(tmp_path):
     file_path = str(tmp_path / "no_ws.yaml")
     result = write_yaml_direct(file_path, {"test": True}, workspace=None)
     assert result == file_path
-    with open(file_path) as f:
-        assert yaml.safe_load(f) == {"test": True}
+    assert yaml.load(Path(file_path).read_bytes(), Loader=_YLoader) == {"test": True}
 
 
 # ─── read_file_direct without logger (error path, line 120->125) ───
@@ -1152,7 +1319,7 @@ def test_append_file_direct_creates_new_file(tmp_path):
     file_path = tmp_path / "subdir" / "new_append.txt"
     result = append_file_direct(str(file_path), "new content", tmp_path)
     assert result == str(file_path)
-    assert file_path.read_text() == "new content"
+    _assert_text_eq(file_path, "new content")
 
 
 # ─── delete_file_direct on non-existent file ───
@@ -3,6 +3,7 @@
 import pytest
 
 from yaml_workflow.engine import WorkflowEngine
+from yaml_workflow.tasks.file_tasks import _load_yaml, read_yaml, write_yaml_direct
 
 
 def make_workflow(num_steps, task_type="noop"):
@@ -159,3 +160,39 @@ def test_context_size_impact(benchmark, tmp_path):
         engine.run()
 
     benchmark(run)
+
+
+# ---------------------------------------------------------------------------
+# Parsed YAML cache
+# ---------------------------------------------------------------------------
+
+
+def _write_records(tmp_path):
+    """Write a 500-record YAML document and return its workspace-relative name."""
+    records = [
+        {"id": i, "name": f"item_{i}", "tags": ["a", "b"], "value": {"x": i * 1.5}}
+        for i in range(500)
+    ]
+    write_yaml_direct("records.yaml", records, workspace=tmp_path)
+    return "records.yaml"
+
+
+@pytest.mark.benchmark(group="read_yaml")
+def test_read_yaml_cold(benchmark, tmp_path):
+    """Benchmark read_yaml when every call has to parse the file."""
+    name = _write_records(tmp_path)
+
+    def run():
+        _load_yaml.cache_clear()
+        return read_yaml(name, tmp_path)
+
+    benchmark(run)
+
+
+@pytest.mark.benchmark(group="read_yaml")
+def test_read_yaml_cached(benchmark, tmp_path):
+    """Benchmark read_yaml on a cache hit (parse skipped, result deep-copied)."""
+    name = _write_records(tmp_path)
+    read_yaml(name, tmp_path)
+
+    benchmark(read_yaml, name, tmp_path)
@@ -9,7 +9,7 @@ from unittest.mock import patch
 import pytest
 
 from yaml_workflow.engine import WorkflowEngine
-from yaml_workflow.exceptions import TaskExecutionError, WorkflowError
+from yaml_workflow.exceptions import WorkflowError
 
 # Import tasks to ensure registration
 from yaml_workflow.tasks import python_tasks
@@ -600,6 +600,23 @@ def test_load_function_not_callable(tmp_path: Path, test_module_file):
     assert "not callable" in str(e.value.original_error)
 
 
+def test_load_function_waits_for_initializing_module(monkeypatch):
+    """Test _load_function imports a module another thread is still initializing."""
+    import importlib.machinery
+    import types
+
+    partial = types.ModuleType("half_imported_mod")
+    partial.__spec__ = importlib.machinery.ModuleSpec("half_imported_mod", None)
+    partial.__spec__._initializing = True  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "half_imported_mod", partial)
+
+    finished = types.ModuleType("half_imported_mod")
+    finished.ready = lambda: "ok"  # type: ignore[attr-defined]
+    monkeypatch.setattr(python_tasks.importlib, "import_module", lambda name: finished)
+
+    assert python_tasks._load_function("half_imported_mod", "ready")() == "ok"
+
+
 # === Tests for _execute_python_function args/kwargs type validation (lines 122, 124) ===
 
 
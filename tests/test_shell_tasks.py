@@ -18,6 +18,7 @@ from yaml_workflow.tasks.shell_tasks import (
     set_environment,
     shell_task,
 )
+from yaml_workflow.template import compile_template
 
 # Mark for tests that rely on bash/unix-specific shell syntax or commands.
 # These are skipped on Windows where cmd.exe / PowerShell behave differently.
@@ -347,6 +348,17 @@ def test_shell_missing_command_parameter(workspace, basic_context):
     assert "command parameter is required" in str(exc_info.value.original_error)
 
 
+def test_shell_process_command_compiles_once(basic_context):
+    """Test repeated renders of one command reuse the compiled template."""
+    command = "echo {{ args.test_arg }} {{ index }} # compile-once"
+    process_command(command, {**basic_context, "index": 0})
+    misses = compile_template.cache_info().misses
+    for index in range(1, 3):
+        result = process_command(command, {**basic_context, "index": index})
+        assert result == f"echo value1 {index} # compile-once"
+    assert compile_template.cache_info().misses == misses
+
+
 def test_shell_process_command_undefined_variable_detail(workspace, basic_context):
     """Test process_command template failure with detailed context check."""
     command_template = "echo 'Undefined: {{ missing_var }}'"
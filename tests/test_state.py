@@ -128,6 +128,29 @@ def test_namespace_state_persistence(temp_workspace, workflow_state):
     assert new_state.get_variable("PATH", "env") == "/usr/bin"
 
 
+def test_deferred_save_writes_once(temp_workspace, workflow_state):
+    """Test that saves inside deferred_save() are flushed once on exit."""
+    with workflow_state.deferred_save():
+        workflow_state.update_namespace("args", {"key": "value"})
+        with workflow_state.deferred_save():
+            workflow_state.mark_step_success("step1", {"result": 1})
+        assert WorkflowState(temp_workspace).get_variable("key", "args") is None
+
+    new_state = WorkflowState(temp_workspace)
+    assert new_state.get_variable("key", "args") == "value"
+    assert new_state.get_executed_steps() == ["step1"]
+
+
+def test_save_failure_keeps_previous_file(temp_workspace, workflow_state):
+    """Test that a state that cannot be encoded does not truncate the file."""
+    workflow_state.update_namespace("args", {"key": "value"})
+    workflow_state.metadata["namespaces"]["args"]["bad"] = object()
+    with pytest.raises(TypeError):
+        workflow_state.save()
+
+    assert WorkflowState(temp_workspace).get_variable("key", "args") == "value"
+
+
 def test_batch_state_initialization(batch_state):
     """Test batch state initialization."""
     assert batch_state.state["processed"] == []
@@ -166,6 +189,24 @@ def test_batch_state_persistence(temp_workspace):
     assert loaded_state.state["stats"]["processed"] == 1
 
 
+def test_batch_state_processed_deduplicated(temp_workspace):
+    """Test that items already processed, including reloaded ones, count once."""
+    state = BatchState(temp_workspace, "test_dedup")
+    state.mark_processed("item1", {})
+    state.mark_processed("item1", {})
+    state.save()
+
+    loaded_state = BatchState(temp_workspace, "test_dedup")
+    loaded_state.mark_processed("item1", {})
+    loaded_state.mark_processed(2, {})
+    assert loaded_state.state["processed"] == ["item1", "2"]
+    assert loaded_state.get_stats()["processed"] == 2
+
+    loaded_state.reset()
+    loaded_state.mark_processed("item1", {})
+    assert loaded_state.state["processed"] == ["item1"]
+
+
 def test_retry_state_management(workflow_state):
     """Test retry count state management."""
     # Initially, count is 0
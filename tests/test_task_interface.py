@@ -123,6 +123,20 @@ def test_process_inputs_caching(basic_step, context_with_namespaces, workspace):
     assert first_result["message"] == "Hello World"
 
 
+def test_get_input_renders_only_requested_key(
+    basic_step, context_with_namespaces, workspace
+):
+    """Test get_input resolves one input without touching the others."""
+    config = TaskConfig(basic_step, context_with_namespaces, workspace)
+    config.inputs["bad_template"] = "{{ args.undefined }}"
+
+    assert config.get_input("message") == "Hello World"
+    assert config.get_input("count") == 42
+    assert config.get_input("missing", "fallback") == "fallback"
+    with pytest.raises(TemplateError):
+        config.get_input("bad_template")
+
+
 def test_process_inputs_undefined_variable(
     basic_step, context_with_namespaces, workspace
 ):
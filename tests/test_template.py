@@ -35,6 +35,37 @@ def test_process_template(template_engine, variables):
     assert result == "Input: input.txt, Output: output.txt"
 
 
+def test_process_template_compiles_once(template_engine, variables):
+    """Test repeated renders of one template reuse the compiled template."""
+    template = "{{ args.input_file }} -> {{ batch.index }}"
+    for index in range(3):
+        variables["batch"]["index"] = index
+        result = template_engine.process_template(template, variables)
+        assert result == f"input.txt -> {index}"
+    assert template_engine._compile.cache_info().misses == 1
+
+
+@pytest.mark.parametrize("text", ["plain", "line\n", "a { b } c", "crlf\r\n"])
+def test_process_template_plain_text(template_engine, variables, text):
+    """Test text without Jinja markup renders exactly as Jinja would."""
+    expected = template_engine.env.from_string(text).render()
+    assert template_engine.process_template(text, variables) == expected
+
+
+def test_process_template_searchpath_env_reused(template_engine, variables, tmp_path):
+    """Test renders with includes share one environment per search path."""
+    (tmp_path / "part.txt").write_text("part 1")
+    template = "{% include 'part.txt' %} {{ batch.index }}"
+    assert template_engine.process_template(template, variables, str(tmp_path)) == (
+        "part 1 0"
+    )
+    (tmp_path / "part.txt").write_text("part 2!")
+    assert template_engine.process_template(template, variables, str(tmp_path)) == (
+        "part 2! 0"
+    )
+    assert template_engine._search_env.cache_info().misses == 1
+
+
 def test_process_template_undefined_variable(template_engine, variables):
     """Test processing a template with undefined variable."""
     template = '{{ args["missing"] }}'
@@ -130,6 +161,23 @@ def test_process_value_list(template_engine, variables):
     assert result == ["input.txt", "/home/user"]
 
 
+def test_process_value_wraps_variables_once(template_engine, variables, monkeypatch):
+    """Test all leaves of one value render against a single AttrDict."""
+    wrapped = []
+    original_init = AttrDict.__init__
+
+    def counting_init(self, *args, **kwargs):
+        if args and args[0] is variables:
+            wrapped.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(AttrDict, "__init__", counting_init)
+    value = {"in": "in: {{ args.input_file }}", "more": ["home: {{ env.HOME }}"]}
+    result = template_engine.process_value(value, variables)
+    assert result == {"in": "in: input.txt", "more": ["home: /home/user"]}
+    assert len(wrapped) == 1
+
+
 def test_process_value_non_template(template_engine, variables):
     """Test processing non-template value."""
     value = 42
@@ -31,6 +31,25 @@ def test_load_workflow_invalid_yaml():
         os.remove("invalid_yaml.yaml")
 
 
+def test_load_workflow_invalid_yaml_names_file(tmp_path):
+    """Test that YAML syntax errors point at the workflow file."""
+    workflow_file = tmp_path / "broken.yaml"
+    workflow_file.write_text("steps:\n  - name: a\n    task: [noop\n")
+    with pytest.raises(WorkflowError, match=r'in ".*broken\.yaml", line'):
+        WorkflowEngine(str(workflow_file))
+
+
+def test_load_workflow_raw_tag(tmp_path):
+    """Test that the !raw tag is understood when loading workflow files."""
+    workflow_file = tmp_path / "raw.yaml"
+    workflow_file.write_text(
+        "steps:\n  - name: a\n    task: noop\n    inputs:\n"
+        "      text: !raw '{{ not_rendered }}'\n"
+    )
+    engine = WorkflowEngine(str(workflow_file), base_dir=str(tmp_path / "runs"))
+    assert engine.workflow["steps"][0]["inputs"]["text"] == "{{ not_rendered }}"
+
+
 def test_load_workflow_invalid_structure():
     """Test that attempting to load a YAML file with invalid top-level keys raises ConfigurationError."""
     # Create a temporary file with valid YAML but invalid workflow structure (unexpected top-level key)